@@ -9,15 +9,93 @@ It provides purpose-oriented enhancement with multi-perspective reviews and self
 import sys
 import os
 import argparse
+import glob
+import hashlib
 import json
+import multiprocessing
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from collections import Counter
 import re
 
+# orjson があれば C 実装のエンコーダ・デコーダで JSON を扱う
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def _dump_json(obj: Any) -> bytes:
+    """Encode results as indented UTF-8 JSON"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _load_json(data: bytes) -> Any:
+    """Decode JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _scan_headings(content: str) -> List[Tuple[int, str]]:
+    """Collect (level, title) for ATX headings using plain string checks"""
+    headings = []
+    for line in content.splitlines():
+        if not line.startswith('#'):
+            continue
+        level = 0
+        while level < 6 and level < len(line) and line[level] == '#':
+            level += 1
+        if level < len(line) and line[level] in ' \t':
+            title = line[level + 1:].strip()
+            if title:
+                headings.append((level, title))
+    return headings
+
+
+# 正規表現はモジュール読み込み時に一度だけコンパイルする
+_CODE_BLOCK_RE = re.compile(r'```[\s\S]*?```')
+_LINK_RE = re.compile(r'\[.*?\]\(.*?\)')
+_MAJOR_STRUCTURE_RE = re.compile(r'no clear|skipped|missing', re.IGNORECASE)
+_IMPORTANT_GAP_RE = re.compile(r'error|security|performance', re.IGNORECASE)
+
+_PURPOSE_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in (
+        r'# .*[Pp]urpose[:]?\s*([^\n]+)',
+        r'## [Aa]bout\s*([^\n]+)',
+        r'## [Ii]ntroduction\s*([^\n]+)',
+        r'This document ([^.]+)',
+    )
+]
+
+_AUDIENCE_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in (
+        r'[Tt]arget.*[Aa]udience[:]?\s*([^\n]+)',
+        r'[Ff]or[:]?\s*([^\n]+)',
+        r'[Tt]his.*[Ii]s.*[Ff]or[:]?\s*([^\n]+)',
+    )
+]
+
+# レビューキャッシュのキーに含めるバージョン
+# 解析・レビューの処理やキャッシュの形式を変えたら上げ、古い結果を無効にする
+_REVIEW_CACHE_VERSION = 1
+
 # 共通ライブラリパスを追加（.claudeディレクトリを動的に探す）
+@lru_cache(maxsize=1)
 def find_claude_lib():
+    # CLAUDE_LIB_PATH が設定されていればディレクトリ探索を省略する
+    env_path = os.environ.get('CLAUDE_LIB_PATH')
+    if env_path:
+        return env_path
+
     current = Path(__file__).resolve()
     for _ in range(8):  # 最大8階層まで遡る
         claude_lib = current / '.claude' / 'lib'
@@ -44,6 +122,42 @@ def main():
     return improve_document_cli()
 
 
+@dataclass
+class DocumentFeatures:
+    """Document features scanned once and shared by the analyzer and reviewers"""
+    content: str
+    lower: str
+    headings: List[Tuple[int, str]]
+    code_blocks: List[str]
+    links_present: bool
+    line_count: int
+    total_line_len: int
+
+    @classmethod
+    def from_content(cls, content: str) -> 'DocumentFeatures':
+        """Scan document content once"""
+        # Line statistics from C-level len/count instead of splitting into lines
+        newline_count = content.count('\n')
+        return cls(
+            content=content,
+            lower=content.lower(),
+            headings=_scan_headings(content),
+            code_blocks=_CODE_BLOCK_RE.findall(content),
+            links_present=_LINK_RE.search(content) is not None,
+            line_count=newline_count + 1,
+            total_line_len=len(content) - newline_count
+        )
+
+    @classmethod
+    def from_file(cls, file_path: Path) -> 'DocumentFeatures':
+        """Read a document and scan its content once"""
+        # Single raw read + decode; newlines normalized as text mode would
+        content = file_path.read_bytes().decode('utf-8')
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return cls.from_content(content)
+
+
 @dataclass
 class DocumentAnalysis:
     """Document analysis results"""
@@ -106,10 +220,30 @@ class TechnicalDocumentAnalyzer:
             'troubleshooting': self.technical_patterns['troubleshooting']
         }
 
-    def analyze_document(self, file_path: Path) -> DocumentAnalysis:
+        # Distinct expected sections and their owning category
+        self._section_category = {
+            section: category
+            for category, sections in self.completeness_criteria.items()
+            for section in sections
+        }
+        self._all_sections = frozenset(self._section_category)
+
+        # Common gaps for technical documentation (keywords pre-lowered once)
+        self.gap_checks = {
+            'error_handling': ['error', 'exception', 'failure', 'issue'],
+            'performance': ['performance', 'optimization', 'benchmark', 'speed'],
+            'security': ['security', 'authentication', 'authorization', 'token'],
+            'testing': ['test', 'testing', 'validation', 'verification'],
+            'versioning': ['version', 'compatibility', 'migration', 'upgrade']
+        }
+        self._gap_checks_lc = {
+            gap_type: [keyword.lower() for keyword in keywords]
+            for gap_type, keywords in self.gap_checks.items()
+        }
+
+    def analyze_document(self, features: DocumentFeatures) -> DocumentAnalysis:
         """Analyze document structure and completeness"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = features.content
 
         # Extract purpose and target audience
         purpose = self._extract_purpose(content)
@@ -120,8 +254,8 @@ class TechnicalDocumentAnalyzer:
 
         # Identify missing sections and issues
         missing_sections = self._identify_missing_sections(content)
-        structure_issues = self._identify_structure_issues(content)
-        content_gaps = self._identify_content_gaps(content, purpose)
+        structure_issues = self._identify_structure_issues(features)
+        content_gaps = self._identify_content_gaps(features.lower, purpose)
 
         # Determine improvement areas
         improvement_areas = self._prioritize_improvement_areas(
@@ -141,15 +275,8 @@ class TechnicalDocumentAnalyzer:
     def _extract_purpose(self, content: str) -> str:
         """Extract document purpose from content"""
         # Look for purpose statements in introduction
-        purpose_patterns = [
-            r'# .*[Pp]urpose[:]?\s*([^\n]+)',
-            r'## [Aa]bout\s*([^\n]+)',
-            r'## [Ii]ntroduction\s*([^\n]+)',
-            r'This document ([^.]+)',
-        ]
-
-        for pattern in purpose_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
+        for pattern in _PURPOSE_PATTERNS:
+            match = pattern.search(content)
             if match:
                 return match.group(1).strip()
 
@@ -157,14 +284,8 @@ class TechnicalDocumentAnalyzer:
 
     def _extract_audience(self, content: str) -> str:
         """Extract target audience from content"""
-        audience_patterns = [
-            r'[Tt]arget.*[Aa]udience[:]?\s*([^\n]+)',
-            r'[Ff]or[:]?\s*([^\n]+)',
-            r'[Tt]his.*[Ii]s.*[Ff]or[:]?\s*([^\n]+)',
-        ]
-
-        for pattern in audience_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
+        for pattern in _AUDIENCE_PATTERNS:
+            match = pattern.search(content)
             if match:
                 return match.group(1).strip()
 
@@ -172,33 +293,21 @@ class TechnicalDocumentAnalyzer:
 
     def _calculate_completeness(self, content: str) -> float:
         """Calculate completeness score based on expected sections"""
-        total_expected = sum(len(sections) for sections in self.completeness_criteria.values())
-        found_sections = 0
-
-        for category, sections in self.completeness_criteria.items():
-            for section in sections:
-                if section in content:
-                    found_sections += 1
-
-        return found_sections / max(total_expected, 1)
+        found_sections = sum(1 for section in self._all_sections if section in content)
+        return found_sections / max(len(self._all_sections), 1)
 
     def _identify_missing_sections(self, content: str) -> List[str]:
         """Identify missing important sections"""
-        missing = []
+        return [f"{category}: {section}"
+                for section, category in self._section_category.items()
+                if section not in content]
 
-        for category, sections in self.completeness_criteria.items():
-            for section in sections:
-                if section not in content:
-                    missing.append(f"{category}: {section}")
-
-        return missing
-
-    def _identify_structure_issues(self, content: str) -> List[str]:
+    def _identify_structure_issues(self, features: DocumentFeatures) -> List[str]:
         """Identify structural issues in the document"""
         issues = []
 
         # Check heading hierarchy
-        headings = re.findall(r'^(#{1,6})\s+(.+)$', content, re.MULTILINE)
+        headings = features.headings
         if not headings:
             issues.append("No clear heading structure")
         else:
@@ -207,33 +316,24 @@ class TechnicalDocumentAnalyzer:
             for level, title in headings:
                 if level > prev_level + 1:
                     issues.append(f"Skipped heading level from {prev_level} to {level}")
-                prev_level = len(level)
+                prev_level = level
 
         # Check for code examples
-        if not re.search(r'```[\s\S]*?```', content):
+        if not features.code_blocks:
             issues.append("No code examples found")
 
         # Check for links
-        if not re.search(r'\[.*?\]\(.*?\)', content):
+        if not features.links_present:
             issues.append("No external links or references found")
 
         return issues
 
-    def _identify_content_gaps(self, content: str, purpose: str) -> List[str]:
+    def _identify_content_gaps(self, lower_content: str, purpose: str) -> List[str]:
         """Identify content gaps based on document purpose"""
         gaps = []
 
-        # Common gaps for technical documentation
-        gap_checks = {
-            'error_handling': ['error', 'exception', 'failure', 'issue'],
-            'performance': ['performance', 'optimization', 'benchmark', 'speed'],
-            'security': ['security', 'authentication', 'authorization', 'token'],
-            'testing': ['test', 'testing', 'validation', 'verification'],
-            'versioning': ['version', 'compatibility', 'migration', 'upgrade']
-        }
-
-        for gap_type, keywords in gap_checks.items():
-            if not any(keyword.lower() in content.lower() for keyword in keywords):
+        for gap_type, keywords in self._gap_checks_lc.items():
+            if not any(keyword in lower_content for keyword in keywords):
                 gaps.append(f"Missing {gap_type.replace('_', ' ')} information")
 
         return gaps
@@ -254,22 +354,22 @@ class TechnicalDocumentAnalyzer:
         prioritized = []
 
         # Categorize and prioritize
+        missing_top3 = ', '.join(missing[:3])
         if missing:
-            prioritized.extend([f"Critical missing sections: {', '.join(missing[:3])}"])
+            prioritized.append(f"Critical missing sections: {missing_top3}")
 
-        major_structure = [s for s in structure if any(keyword in s.lower()
-                          for keyword in ['no clear', 'skipped', 'missing'])]
+        major_structure = [s for s in structure if _MAJOR_STRUCTURE_RE.search(s)]
         if major_structure:
-            prioritized.extend([f"Structure issues: {', '.join(major_structure)}"])
+            prioritized.append(f"Structure issues: {', '.join(major_structure)}")
 
-        important_gaps = [g for g in content_gaps if any(keyword in g.lower()
-                         for keyword in ['error', 'security', 'performance'])]
+        important_gaps = [g for g in content_gaps if _IMPORTANT_GAP_RE.search(g)]
         if important_gaps:
-            prioritized.extend([f"Important gaps: {', '.join(important_gaps)}"])
+            prioritized.append(f"Important gaps: {', '.join(important_gaps)}")
 
         # Add remaining issues
+        already_listed = set(major_structure) | set(important_gaps)
         remaining = [item for item in missing + structure + content_gaps
-                    if item not in (major_structure + important_gaps)]
+                    if item not in already_listed]
         if remaining:
             prioritized.append(f"Additional improvements: {', '.join(remaining[:5])}")
 
@@ -301,44 +401,49 @@ class MultiPerspectiveReviewer:
             }
         }
 
-    def review_document(self, file_path: Path, analysis: DocumentAnalysis) -> List[ReviewResult]:
+        # Keyword groups matched as substrings of the pre-lowered content
+        self._api_kw = ('api', 'endpoint', 'method')
+        self._resp_kw = ('response', 'status', 'error')
+        self._secperf_kw = ('security', 'performance')
+        self._example_kw = ('example', 'use case', 'scenario')
+        self._practice_kw = ('exercise', 'practice', 'try')
+
+    def review_document(self, features: DocumentFeatures,
+                        analysis: DocumentAnalysis) -> List[ReviewResult]:
         """Conduct multi-perspective review"""
         results = []
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
         # Technical review
-        results.append(self._technical_review(content, analysis))
+        results.append(self._technical_review(features, analysis))
 
         # UX review
-        results.append(self._ux_review(content, analysis))
+        results.append(self._ux_review(features, analysis))
 
         # Educational review
-        results.append(self._educational_review(content, analysis))
+        results.append(self._educational_review(features, analysis))
 
         return results
 
-    def _technical_review(self, content: str, analysis: DocumentAnalysis) -> ReviewResult:
+    def _technical_review(self, features: DocumentFeatures, analysis: DocumentAnalysis) -> ReviewResult:
         """Technical perspective review"""
         feedback = []
         suggestions = []
         priority_issues = []
 
         # Technical accuracy checks
-        if '```' not in content:
+        if '```' not in features.content:
             feedback.append("Missing code examples")
             priority_issues.append("Add code examples")
             suggestions.append("Include practical code samples")
 
         # API documentation checks
-        if any(keyword in content.lower() for keyword in ['api', 'endpoint', 'method']):
-            if not any(keyword in content.lower() for keyword in ['response', 'status', 'error']):
+        if any(keyword in features.lower for keyword in self._api_kw):
+            if not any(keyword in features.lower for keyword in self._resp_kw):
                 feedback.append("Incomplete API documentation")
                 suggestions.append("Add response formats and error handling")
 
         # Best practices
-        if not any(keyword in content.lower() for keyword in ['security', 'performance']):
+        if not any(keyword in features.lower for keyword in self._secperf_kw):
             feedback.append("Missing security/performance considerations")
             suggestions.append("Include security and performance guidance")
 
@@ -353,28 +458,26 @@ class MultiPerspectiveReviewer:
             priority_issues=priority_issues
         )
 
-    def _ux_review(self, content: str, analysis: DocumentAnalysis) -> ReviewResult:
+    def _ux_review(self, features: DocumentFeatures, analysis: DocumentAnalysis) -> ReviewResult:
         """UX perspective review"""
         feedback = []
         suggestions = []
         priority_issues = []
 
         # Readability checks
-        lines = content.split('\n')
-        avg_line_length = sum(len(line) for line in lines) / max(len(lines), 1)
+        avg_line_length = features.total_line_len / max(features.line_count, 1)
 
         if avg_line_length > 100:
             feedback.append("Lines are too long for readability")
             suggestions.append("Break long lines and use shorter sentences")
 
         # Navigation checks
-        headings = re.findall(r'^(#{1,6})\s+(.+)$', content, re.MULTILINE)
-        if len(headings) < 5:
+        if len(features.headings) < 5:
             feedback.append("Insufficient section organization")
             suggestions.append("Add more sections for better navigation")
 
         # User focus checks
-        if not any(keyword in content.lower() for keyword in ['example', 'use case', 'scenario']):
+        if not any(keyword in features.lower for keyword in self._example_kw):
             feedback.append("Lacks user-focused examples")
             suggestions.append("Add practical use cases and scenarios")
 
@@ -389,20 +492,19 @@ class MultiPerspectiveReviewer:
             priority_issues=priority_issues
         )
 
-    def _educational_review(self, content: str, analysis: DocumentAnalysis) -> ReviewResult:
+    def _educational_review(self, features: DocumentFeatures, analysis: DocumentAnalysis) -> ReviewResult:
         """Educational perspective review"""
         feedback = []
         suggestions = []
         priority_issues = []
 
         # Learning progression checks
-        sections = re.split(r'\n## ', content)
-        if len(sections) < 4:
+        if features.content.count('\n## ') < 3:
             feedback.append("Insufficient structure for learning progression")
             suggestions.append("Organize content into logical learning sections")
 
         # Example quality checks
-        code_blocks = re.findall(r'```[\s\S]*?```', content)
+        code_blocks = features.code_blocks
         if code_blocks:
             for i, block in enumerate(code_blocks):
                 if len(block.split('\n')) < 3:
@@ -413,7 +515,7 @@ class MultiPerspectiveReviewer:
             suggestions.append("Add comprehensive code examples")
 
         # Practice opportunities
-        if not any(keyword in content.lower() for keyword in ['exercise', 'practice', 'try']):
+        if not any(keyword in features.lower for keyword in self._practice_kw):
             feedback.append("No practice exercises or activities")
             suggestions.append("Add hands-on exercises or try-it-yourself sections")
 
@@ -543,6 +645,15 @@ class ImprovementPlanGenerator:
         )
 
 
+def _to_dict(obj: Any) -> Dict[str, Any]:
+    """View a result dataclass as a plain dict for JSON output.
+
+    Results are never mutated after construction, so the instance's own
+    field dict is shallow-copied instead of deep-copied like asdict().
+    """
+    return dict(vars(obj))
+
+
 class DocumentImprover:
     """Main document improvement orchestrator"""
 
@@ -574,31 +685,58 @@ class DocumentImprover:
 
         print(f"🚀 Starting improvement process for: {file_path}")
 
-        # Initial analysis
-        print("📊 Conducting initial analysis...")
-        analysis = self.analyzer.analyze_document(file_path)
-        print(f"   Initial completeness score: {analysis.completeness_score:.2f}")
+        resolved_path = str(file_path.resolve())
+        stat = file_path.stat()
+        cache_file = self._cache_file(output_dir, resolved_path, stat)
+        cached = self._load_cached_review(cache_file)
+
+        if cached is not None:
+            print("📦 Using cached analysis and reviews (file unchanged)")
+            analysis, reviews = cached
+            print(f"   Initial completeness score: {analysis.completeness_score:.2f}")
+        else:
+            # Initial analysis (the document is scanned once for the analyzer and all reviewers)
+            print("📊 Conducting initial analysis...")
+            features = DocumentFeatures.from_file(file_path)
+            analysis = self.analyzer.analyze_document(features)
+            print(f"   Initial completeness score: {analysis.completeness_score:.2f}")
+
+            # Initial review
+            print("🔍 Conducting initial multi-perspective review...")
+            reviews = self.reviewer.review_document(features, analysis)
+            self._store_cached_review(cache_file, analysis, reviews)
 
-        # Initial review
-        print("🔍 Conducting initial multi-perspective review...")
-        reviews = self.reviewer.review_document(file_path, analysis)
         for review in reviews:
             print(f"   {review.reviewer_type.title()} score: {review.score:.2f}")
 
+        # analysis and reviews do not change across iterations; serialize them once
+        analysis_dict = _to_dict(analysis)
+        reviews_dicts = [_to_dict(review) for review in reviews]
+        seen_plans = set()
+
         for iteration in range(1, max_iterations + 1):
             print(f"\n🔄 Iteration {iteration}/{max_iterations}")
 
             # Generate improvement plan
             plan = self.planner.generate_plan(analysis, reviews, iteration)
+
+            # Stop once the plan no longer changes between iterations
+            plan_key = (tuple(plan.focus_areas),
+                        tuple(sorted(action['action'] for action in plan.specific_actions)))
+            if plan_key in seen_plans:
+                print("   Plan converged, stopping iterations")
+                break
+            seen_plans.add(plan_key)
+
             print(f"   Focus areas: {', '.join(plan.focus_areas)}")
             print(f"   Planned actions: {len(plan.specific_actions)}")
 
             # Store iteration results
             iteration_result = {
                 'iteration': iteration,
-                'analysis': asdict(analysis),
-                'reviews': [asdict(review) for review in reviews],
-                'plan': asdict(plan),
+                'analysis': analysis_dict,
+                'reviews': reviews_dicts,
+                'plan': _to_dict(plan),
                 'improvements_made': []
             }
 
@@ -625,14 +763,46 @@ class DocumentImprover:
         results['final_assessment'] = self._generate_final_assessment(results['iterations'])
         results['improvement_summary'] = self._generate_improvement_summary(results['iterations'])
 
-        # Save results
-        results_file = output_dir / f'improvement_results_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
-        with open(results_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        # Save results (a short path hash keeps same-named files in a shared
+        # output directory from overwriting each other)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path_hash = hashlib.blake2b(resolved_path.encode('utf-8'), digest_size=4).hexdigest()
+        results_file = output_dir / f'improvement_results_{file_path.stem}_{path_hash}_{timestamp}.json'
+        with open(results_file, 'wb') as f:
+            f.write(_dump_json(results))
 
         print(f"\n📋 Improvement complete! Results saved to: {results_file}")
         return results
 
+    def _cache_file(self, output_dir: Path, resolved_path: str, stat: os.stat_result) -> Path:
+        """Cache entry for a file, keyed by cache version, path, mtime and size"""
+        key = hashlib.blake2b(
+            f"{_REVIEW_CACHE_VERSION}:{resolved_path}:{stat.st_mtime_ns}:{stat.st_size}".encode('utf-8')
+        ).hexdigest()
+        return output_dir / '.cache' / f'{key}.json'
+
+    def _load_cached_review(self, cache_file: Path) -> Optional[Tuple[DocumentAnalysis, List[ReviewResult]]]:
+        """Load cached analysis and reviews, or None on a miss"""
+        try:
+            data = _load_json(cache_file.read_bytes())
+            analysis = DocumentAnalysis(**data['analysis'])
+            reviews = [ReviewResult(**review) for review in data['reviews']]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return analysis, reviews
+
+    def _store_cached_review(self, cache_file: Path, analysis: DocumentAnalysis,
+                             reviews: List[ReviewResult]) -> None:
+        """Persist analysis and reviews; caching failures are not fatal"""
+        try:
+            cache_file.parent.mkdir(exist_ok=True)
+            cache_file.write_bytes(_dump_json({
+                'analysis': _to_dict(analysis),
+                'reviews': [_to_dict(review) for review in reviews]
+            }))
+        except OSError:
+            pass
+
     def _apply_improvements(self, file_path: Path, plan: ImprovementPlan,
                           iteration: int, output_dir: Path) -> List[str]:
         """Apply improvements to document (simulated)"""
@@ -694,19 +864,74 @@ class DocumentImprover:
             all_focus_areas.extend(iteration['plan']['focus_areas'])
 
         # Count frequency of focus areas
-        focus_area_counts = {}
-        for area in all_focus_areas:
-            focus_area_counts[area] = focus_area_counts.get(area, 0) + 1
+        focus_area_counts = Counter(all_focus_areas)
 
         return {
             'total_improvements': len(all_improvements),
             'improvements_by_iteration': [len(iter['improvements_made']) for iter in iterations],
-            'most_addressed_areas': sorted(focus_area_counts.items(),
-                                         key=lambda x: x[1], reverse=True),
-            'improvement_categories': list(set(all_focus_areas))
+            'most_addressed_areas': focus_area_counts.most_common(),
+            'improvement_categories': list(focus_area_counts)
         }
 
 
+# バッチ処理ワーカーごとに一度だけ構築する DocumentImprover
+_IMPROVER: Optional['DocumentImprover'] = None
+
+
+def _worker_init(threshold: float, max_iterations: int) -> None:
+    """Pool initializer: build the analyzer/reviewer/planner once per worker"""
+    global _IMPROVER
+    _IMPROVER = DocumentImprover()
+    _IMPROVER.improvement_threshold = threshold
+    _IMPROVER.max_iterations = max_iterations
+
+
+def _worker_process(file_path: Path, output_dir: Optional[Path]) -> Dict[str, Any]:
+    """Pool task: run the improvement loop for one document"""
+    # Report failures per file instead of aborting the whole batch
+    try:
+        return _IMPROVER.improve_document(file_path, output_dir=output_dir)
+    except Exception as e:
+        return {'original_file': str(file_path), 'error': str(e)}
+
+
+def _improve_batch(args: argparse.Namespace) -> int:
+    """Improve every markdown file matching --glob using a worker pool"""
+    # Only an explicit '**' recurses; absolute patterns are matched as given
+    files = [Path(match) for match in glob.glob(args.glob, recursive=True)
+             if match.lower().endswith('.md') and os.path.isfile(match)]
+    if not files:
+        print(f"❌ Error: No markdown files match '{args.glob}'")
+        return 1
+
+    print(f"📚 Processing {len(files)} documents with {args.workers or os.cpu_count()} workers")
+    with multiprocessing.Pool(args.workers, initializer=_worker_init,
+                              initargs=(args.threshold, args.max_iterations)) as pool:
+        all_results = pool.starmap(_worker_process,
+                                   [(file_path, args.output_dir) for file_path in files])
+
+    if args.export_json:
+        with open(args.export_json, 'wb') as f:
+            f.write(_dump_json(all_results))
+        print(f"📄 Results exported to: {args.export_json}")
+
+    print(f"\n📊 Batch Summary:")
+    failed = 0
+    for results in all_results:
+        if 'error' in results:
+            failed += 1
+            print(f"   ❌ {results['original_file']}: {results['error']}")
+            continue
+        assessment = results['final_assessment']
+        if assessment:
+            print(f"   {results['original_file']}: {assessment['overall_final_score']:.2f}")
+
+    if failed:
+        print(f"❌ {failed} of {len(all_results)} documents failed")
+        return 1
+    return 0
+
+
 def improve_document_cli() -> int:
     """Command-line interface for document improvement"""
     parser = argparse.ArgumentParser(
@@ -722,15 +947,32 @@ Examples:
 
   # Verbose output
   python improve_document.py README.md --verbose
+
+  # Improve every markdown file under docs/ with 4 worker processes
+  python improve_document.py --glob "docs/**/*.md" --workers 4
         """
     )
 
     parser.add_argument(
         'input_file',
         type=Path,
+        nargs='?',
         help='Path to the markdown file to improve'
     )
 
+    parser.add_argument(
+        '--glob', '-g',
+        default=None,
+        help='Improve all markdown files matching this glob pattern (batch mode)'
+    )
+
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=None,
+        help='Number of worker processes for batch mode (default: CPU count)'
+    )
+
     parser.add_argument(
         '--output-dir', '-o',
         type=Path,
@@ -768,12 +1010,12 @@ Examples:
     args = parser.parse_args()
 
     # Validate input
-    if not args.input_file.exists():
-        print(f"❌ Error: Input file '{args.input_file}' does not exist")
+    if args.input_file is None and args.glob is None:
+        print("❌ Error: Specify an input file or --glob pattern")
         return 1
 
-    if not args.input_file.suffix.lower() == '.md':
-        print(f"❌ Error: Input file must be a markdown file (.md)")
+    if args.input_file is not None and args.glob is not None:
+        print("❌ Error: Specify either an input file or --glob pattern, not both")
         return 1
 
     if args.max_iterations < 1:
@@ -784,6 +1026,31 @@ Examples:
         print("❌ Error: Threshold must be between 0.0 and 1.0")
         return 1
 
+    if args.workers is not None and args.workers < 1:
+        print("❌ Error: Workers must be at least 1")
+        return 1
+
+    if args.glob is not None:
+        try:
+            return _improve_batch(args)
+        except KeyboardInterrupt:
+            print("\n⚠️  Improvement process interrupted by user")
+            return 1
+        except Exception as e:
+            print(f"❌ Error during batch improvement process: {e}")
+            if args.verbose:
+                import traceback
+                traceback.print_exc()
+            return 1
+
+    if not args.input_file.exists():
+        print(f"❌ Error: Input file '{args.input_file}' does not exist")
+        return 1
+
+    if not args.input_file.suffix.lower() == '.md':
+        print(f"❌ Error: Input file must be a markdown file (.md)")
+        return 1
+
     try:
         # Create document improver
         improver = DocumentImprover()
@@ -798,8 +1065,8 @@ Examples:
 
         # Export to JSON if requested
         if args.export_json:
-            with open(args.export_json, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
+            with open(args.export_json, 'wb') as f:
+                f.write(_dump_json(results))
             print(f"📄 Results exported to: {args.export_json}")
 
         # Print summary
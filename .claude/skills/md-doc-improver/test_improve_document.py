@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Tests for the markdown document improver
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+script_dir = Path(__file__).parent / "scripts"
+sys.path.insert(0, str(script_dir))
+
+import improve_document
+
+SAMPLE_DOC = """# Sample Tool
+
+## Overview
+
+This document describes the sample tool for developers.
+
+## Usage
+
+```python
+import sample
+sample.run()
+```
+"""
+
+
+def _batch_args(output_dir: Path, **overrides) -> argparse.Namespace:
+    args = {
+        'glob': '**/*.md',
+        'workers': 2,
+        'output_dir': output_dir,
+        'threshold': 0.85,
+        'max_iterations': 2,
+        'export_json': None,
+    }
+    args.update(overrides)
+    return argparse.Namespace(**args)
+
+
+def test_batch_keeps_results_for_same_named_files(tmp_path, monkeypatch):
+    """Same-named documents in different directories get separate result files"""
+    for name in ('a', 'b'):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / 'README.md').write_text(SAMPLE_DOC, encoding='utf-8')
+    output_dir = tmp_path / 'out'
+    output_dir.mkdir()
+    monkeypatch.chdir(tmp_path)
+
+    assert improve_document._improve_batch(_batch_args(output_dir)) == 0
+
+    results = list(output_dir.glob('improvement_results_README_*.json'))
+    assert len(results) == 2
+
+
+def test_batch_reports_failing_file_and_continues(tmp_path, monkeypatch):
+    """One unreadable document is reported without dropping the other results"""
+    (tmp_path / 'good.md').write_text(SAMPLE_DOC, encoding='utf-8')
+    (tmp_path / 'bad.md').write_bytes(b'# Broken \xff\xfe\n')
+    output_dir = tmp_path / 'out'
+    output_dir.mkdir()
+    monkeypatch.chdir(tmp_path)
+
+    assert improve_document._improve_batch(_batch_args(output_dir)) == 1
+
+    assert len(list(output_dir.glob('improvement_results_good_*.json'))) == 1
+
+
+def test_cli_rejects_input_file_with_glob(tmp_path, monkeypatch):
+    """A positional input file is not silently ignored in --glob mode"""
+    doc = tmp_path / 'doc.md'
+    doc.write_text(SAMPLE_DOC, encoding='utf-8')
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, 'argv', ['improve_document.py', str(doc), '--glob', '*.md'])
+
+    assert improve_document.improve_document_cli() == 1
+    assert not (tmp_path / 'improvements').exists()
+
+
+def test_review_cache_is_keyed_on_cache_version(tmp_path, monkeypatch):
+    """Unchanged files reuse cached reviews until the cache version changes"""
+    doc = tmp_path / 'doc.md'
+    doc.write_text(SAMPLE_DOC, encoding='utf-8')
+    output_dir = tmp_path / 'out'
+    improver = improve_document.DocumentImprover()
+
+    improver.improve_document(doc, max_iterations=1, output_dir=output_dir)
+    stat = doc.stat()
+    cache_file = improver._cache_file(output_dir, str(doc.resolve()), stat)
+    assert improver._load_cached_review(cache_file) is not None
+
+    monkeypatch.setattr(improve_document, '_REVIEW_CACHE_VERSION',
+                        improve_document._REVIEW_CACHE_VERSION + 1)
+    bumped_cache_file = improver._cache_file(output_dir, str(doc.resolve()), stat)
+    assert bumped_cache_file != cache_file
+    assert improver._load_cached_review(bumped_cache_file) is None
+
+
+def test_structure_issues_compare_heading_levels():
+    """Heading levels are compared as integers and skipped levels are reported"""
+    features = improve_document.DocumentFeatures.from_content(
+        "# Title\n\n### Deep section\n\n## Section\n"
+    )
+    analysis = improve_document.TechnicalDocumentAnalyzer().analyze_document(features)
+
+    assert "Skipped heading level from 1 to 3" in analysis.structure_issues
+    assert "No clear heading structure" not in analysis.structure_issues
+
+
+def test_reviewer_keywords_match_case_insensitively():
+    """Reviewer keyword checks match substrings regardless of case"""
+    reviewer = improve_document.MultiPerspectiveReviewer()
+    features = improve_document.DocumentFeatures.from_content(
+        "# API\n\nThe ENDPOINT returns a Status.\n\nSecurity notes. Examples. Try it.\n"
+    )
+    analysis = improve_document.TechnicalDocumentAnalyzer().analyze_document(features)
+
+    technical, ux, educational = reviewer.review_document(features, analysis)
+
+    assert "Incomplete API documentation" not in technical.feedback
+    assert "Missing security/performance considerations" not in technical.feedback
+    assert "Lacks user-focused examples" not in ux.feedback
+    assert "No practice exercises or activities" not in educational.feedback
+
+
+def test_batch_glob_recurses_only_with_double_star(tmp_path, monkeypatch):
+    """A plain '*.md' pattern does not pick up documents in subdirectories"""
+    (tmp_path / 'top.md').write_text(SAMPLE_DOC, encoding='utf-8')
+    (tmp_path / 'sub').mkdir()
+    (tmp_path / 'sub' / 'nested.md').write_text(SAMPLE_DOC, encoding='utf-8')
+    output_dir = tmp_path / 'out'
+    output_dir.mkdir()
+    monkeypatch.chdir(tmp_path)
+
+    assert improve_document._improve_batch(_batch_args(output_dir, glob='*.md')) == 0
+
+    assert len(list(output_dir.glob('improvement_results_top_*.json'))) == 1
+    assert not list(output_dir.glob('improvement_results_nested_*.json'))
+
+
+def test_batch_accepts_absolute_glob(tmp_path):
+    """Absolute patterns are matched as given instead of failing"""
+    (tmp_path / 'docs').mkdir()
+    (tmp_path / 'docs' / 'guide.md').write_text(SAMPLE_DOC, encoding='utf-8')
+    output_dir = tmp_path / 'out'
+    output_dir.mkdir()
+
+    pattern = str(tmp_path / 'docs' / '*.md')
+    assert improve_document._improve_batch(_batch_args(output_dir, glob=pattern)) == 0
+
+    assert len(list(output_dir.glob('improvement_results_guide_*.json'))) == 1
@@ -11,7 +11,9 @@ Examples:
     init_skill.py custom-skill --path /custom/location
 """
 
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 SKILL_TEMPLATE = """---
@@ -136,11 +138,19 @@ Example real scripts from other skills:
 - pdf/scripts/convert_pdf_to_images.py - Converts PDF pages to images
 """
 
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Setup common library access for Miyabi skills (dynamic discovery)
+# The nearest .claude/lib is looked up once per process
+@lru_cache(maxsize=1)
 def find_claude_lib():
+    env_path = os.environ.get('MIYABI_CLAUDE_LIB')
+    if env_path:
+        return env_path
+
     current = Path(__file__).resolve()
     for _ in range(8):  # Search up to 8 levels
         claude_lib = current / '.claude' / 'lib'
@@ -238,6 +248,59 @@ Note: This is a text placeholder. Actual assets can be any file type.
 """
 
 
+_PLACEHOLDER_RE = re.compile(r"\{(skill_name|skill_title)\}")
+
+
+def compile_template(template):
+    """
+    Split a template into (literal, placeholder) segments once.
+
+    Args:
+        template: Template string using {skill_name} / {skill_title}
+
+    Returns:
+        List of (literal_chunk, field_name) tuples; the last field_name is None
+    """
+    parts = []
+    pos = 0
+    for match in _PLACEHOLDER_RE.finditer(template):
+        parts.append((template[pos:match.start()], match.group(1)))
+        pos = match.end()
+    parts.append((template[pos:], None))
+    return parts
+
+
+def render(parts, **values):
+    """Render precompiled template segments in a single join."""
+    return "".join(
+        literal if key is None else literal + values[key] for literal, key in parts
+    )
+
+
+SKILL_TEMPLATE_PARTS = compile_template(SKILL_TEMPLATE)
+EXAMPLE_SCRIPT_PARTS = compile_template(EXAMPLE_SCRIPT)
+EXAMPLE_REFERENCE_PARTS = compile_template(EXAMPLE_REFERENCE)
+EXAMPLE_ASSET_BYTES = EXAMPLE_ASSET.encode("utf-8")
+
+
+@lru_cache(maxsize=256)
+def _render_skill_md(skill_name, skill_title):
+    """Render SKILL.md content (memoized per name/title)."""
+    return render(SKILL_TEMPLATE_PARTS, skill_name=skill_name, skill_title=skill_title)
+
+
+@lru_cache(maxsize=256)
+def _render_example_script(skill_name):
+    """Render scripts/example.py content (memoized per name)."""
+    return render(EXAMPLE_SCRIPT_PARTS, skill_name=skill_name)
+
+
+@lru_cache(maxsize=256)
+def _render_example_reference(skill_title):
+    """Render references/api_reference.md content (memoized per title)."""
+    return render(EXAMPLE_REFERENCE_PARTS, skill_title=skill_title)
+
+
 def title_case_skill_name(skill_name):
     """Convert hyphenated skill name to Title Case for display."""
     return " ".join(word.capitalize() for word in skill_name.split("-"))
@@ -265,51 +328,40 @@ def init_skill(skill_name, path):
     # Create skill directory
     try:
         skill_dir.mkdir(parents=True, exist_ok=False)
-        print(f"✅ Created skill directory: {skill_dir}")
     except Exception as e:
         print(f"❌ Error creating directory: {e}")
         return None
 
-    # Create SKILL.md from template
+    # Render every file up front, then write the tree in a single pass
     skill_title = title_case_skill_name(skill_name)
-    skill_content = SKILL_TEMPLATE.format(
-        skill_name=skill_name, skill_title=skill_title
-    )
-
-    skill_md_path = skill_dir / "SKILL.md"
-    try:
-        skill_md_path.write_text(skill_content)
-        print("✅ Created SKILL.md")
-    except Exception as e:
-        print(f"❌ Error creating SKILL.md: {e}")
-        return None
-
-    # Create resource directories with example files
-    try:
-        # Create scripts/ directory with example script
-        scripts_dir = skill_dir / "scripts"
-        scripts_dir.mkdir(exist_ok=True)
-        example_script = scripts_dir / "example.py"
-        example_script.write_text(EXAMPLE_SCRIPT.format(skill_name=skill_name))
-        example_script.chmod(0o755)
-        print("✅ Created scripts/example.py")
-
-        # Create references/ directory with example reference doc
-        references_dir = skill_dir / "references"
-        references_dir.mkdir(exist_ok=True)
-        example_reference = references_dir / "api_reference.md"
-        example_reference.write_text(EXAMPLE_REFERENCE.format(skill_title=skill_title))
-        print("✅ Created references/api_reference.md")
-
-        # Create assets/ directory with example asset placeholder
-        assets_dir = skill_dir / "assets"
-        assets_dir.mkdir(exist_ok=True)
-        example_asset = assets_dir / "example_asset.txt"
-        example_asset.write_text(EXAMPLE_ASSET)
-        print("✅ Created assets/example_asset.txt")
-    except Exception as e:
-        print(f"❌ Error creating resource directories: {e}")
-        return None
+    files = [
+        ("SKILL.md", _render_skill_md(skill_name, skill_title).encode("utf-8"), None),
+        (
+            "scripts/example.py",
+            _render_example_script(skill_name).encode("utf-8"),
+            0o755,
+        ),
+        (
+            "references/api_reference.md",
+            _render_example_reference(skill_title).encode("utf-8"),
+            None,
+        ),
+        ("assets/example_asset.txt", EXAMPLE_ASSET_BYTES, None),
+    ]
+
+    for rel_path, data, mode in files:
+        file_path = skill_dir / rel_path
+        try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_bytes(data)
+            if mode is not None:
+                file_path.chmod(mode)
+        except Exception as e:
+            print(f"❌ Error creating {rel_path}: {e}")
+            return None
+
+    print(f"✅ Created skill directory: {skill_dir}")
+    print("\n".join(f"✅ Created {rel_path}" for rel_path, _, _ in files))
 
     # Print next steps
     print(f"\n✅ Skill '{skill_name}' initialized successfully at {skill_dir}")
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Tests for the skill initializer and its generated example script
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+script_dir = Path(__file__).parent / "scripts"
+sys.path.insert(0, str(script_dir))
+
+from init_skill import init_skill
+
+
+def _load_example(skill_dir: Path):
+    spec = importlib.util.spec_from_file_location(
+        f"example_{skill_dir.name}", skill_dir / "scripts" / "example.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_example_finds_nearest_claude_lib_in_nested_repos(tmp_path, monkeypatch):
+    """The inner repository's .claude/lib wins, and nothing is cached in $HOME"""
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.delenv("MIYABI_CLAUDE_LIB", raising=False)
+
+    outer = tmp_path / "outer"
+    inner = outer / "inner"
+    for repo in (outer, inner):
+        (repo / ".claude" / "lib").mkdir(parents=True)
+        (repo / ".claude" / "skills").mkdir()
+
+    outer_skill = init_skill("outer-skill", outer / ".claude" / "skills")
+    inner_skill = init_skill("inner-skill", inner / ".claude" / "skills")
+
+    outer_lib = _load_example(outer_skill).find_claude_lib()
+    inner_lib = _load_example(inner_skill).find_claude_lib()
+
+    assert outer_lib == str((outer / ".claude" / "lib").resolve())
+    assert inner_lib == str((inner / ".claude" / "lib").resolve())
+    assert not any(home.iterdir())
@@ -7,59 +7,89 @@ Miyabiフレームワークのエージェント連携準備を行う
 """
 
 import argparse
-import json
+import heapq
+import io
+import re
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from json_io import write_json
+
+# タスク辞書で繰り返し使う優先度・種別の値（全タスクで同一オブジェクトを共有）
+_CRITICAL = sys.intern("critical")
+_HIGH = sys.intern("high")
+_TECHNICAL = sys.intern("technical")
+_DEVELOPMENT = sys.intern("development")
+_DATABASE = sys.intern("database")
+_FEATURE = sys.intern("feature")
+_SECURITY = sys.intern("security")
+
+# 優先度のソート順（未知の優先度は末尾）
+_PRIORITY_ORDER = {_CRITICAL: 0, _HIGH: 1, "medium": 2, "low": 3}
+
+# CodeGenAgentに割り当てるタスク種別
+_CODEGEN_TYPES = frozenset({_DEVELOPMENT, _FEATURE, _TECHNICAL})
+
+# 実行計画の各フェーズに振り分けるタスク種別
+_PHASE1_TYPES = frozenset({_TECHNICAL, _DATABASE})
+_PHASE2_TYPES = frozenset({_DEVELOPMENT, _FEATURE})
+_PHASE4_TYPES = frozenset({_SECURITY, "deployment"})
+
+# Markdown見出し（1行単位、見出し記号の後は空白のみ許可）
+_HEADING_RE = re.compile(r"^(#{1,6})[ \t]+(.+)$", re.MULTILINE)
+
 
 class SpecToTasksConverter:
+    # (ファイル名, spec_dataのキー)
+    _SPEC_FILES = (
+        ("requirements.md", "requirements"),
+        ("design.md", "design"),
+        ("tasks.md", "tasks"),
+    )
+
     def __init__(self, spec_path: str, output_path: str):
         self.spec_path = Path(spec_path)
         self.output_path = Path(output_path)
-        self.requirements_md = self.spec_path / "requirements.md"
-        self.design_md = self.spec_path / "design.md"
-        self.tasks_md = self.spec_path / "tasks.md"
 
     def parse_spec_files(self) -> dict:
         """SPECファイル群を解析"""
-        spec_data = {}
-
-        for file_path, file_key in [
-            (self.requirements_md, "requirements"),
-            (self.design_md, "design"),
-            (self.tasks_md, "tasks"),
-        ]:
+        spec_files = []
+        for filename, file_key in self._SPEC_FILES:
+            file_path = self.spec_path / filename
             if file_path.exists():
-                spec_data[file_key] = self._parse_markdown_file(file_path)
+                spec_files.append((file_path, file_key))
 
-        return spec_data
+        # 独立した3ファイルの読み込み・解析を並行実行（結果の順序は維持）
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = {
+                file_key: pool.submit(self._parse_markdown_file, file_path)
+                for file_path, file_key in spec_files
+            }
+            return {file_key: future.result() for file_key, future in futures.items()}
 
     def _parse_markdown_file(self, file_path: Path) -> dict:
         """Markdownファイルを構造化して解析"""
         content = file_path.read_text(encoding="utf-8")
 
-        # 見出しレベルごとにセクションを分割
-        sections = {}
-        current_section = None
-        current_subsections = []
-
-        for line in content.split("\n"):
-            if line.startswith("#"):
-                if current_section:
-                    sections[current_section] = current_subsections
-                    current_subsections = []
-
-                level = len(line) - len(line.lstrip("#"))
-                title = line.lstrip("# ").strip()
-                current_section = {"level": level, "title": title, "content": []}
-            else:
-                if current_section and line.strip():
-                    current_section["content"].append(line)
-
-        if current_section:
-            sections[current_section["title"]] = current_section
-
-        return sections
+        # 見出し位置を1回の正規表現走査で取得し、見出し間を本文としてスライス
+        # (marks, title, body_start, body_end) のタプルに平坦化してから辞書を構築
+        matches = list(_HEADING_RE.finditer(content))
+        ends = [match.start() for match in matches[1:]] + [len(content)]
+        records = [
+            (match.group(1), match.group(2).strip(), match.end(), end)
+            for match, end in zip(matches, ends)
+        ]
+
+        return {
+            title: {
+                "level": len(marks),
+                "title": title,
+                "content": content[start:end].strip("\n"),
+            }
+            for marks, title, start, end in records
+        }
 
     def generate_detailed_tasks(self, spec_data: dict) -> list[dict]:
         """詳細な実行タスクを生成"""
@@ -77,7 +107,13 @@ class SpecToTasksConverter:
         if "tasks" in spec_data:
             tasks = self._refine_existing_tasks(tasks, spec_data["tasks"])
 
-        return self._organize_tasks_by_priority(tasks)
+        # 複数の見出しが同じタスクIDを生成するため、最初の1件のみ残す
+        # （重複IDがあると依存関係の並べ替えが終了しない）
+        unique_tasks = {}
+        for task in tasks:
+            unique_tasks.setdefault(task["id"], task)
+
+        return self._organize_tasks_by_priority(list(unique_tasks.values()))
 
     def _extract_technical_tasks(self, design_sections: dict) -> list[dict]:
         """design.mdから技術的実装タスクを抽出"""
@@ -90,8 +126,8 @@ class SpecToTasksConverter:
                         "id": "ARCH-001",
                         "title": "アーキテクチャ実装",
                         "description": "設計書に基づいたシステムアーキテクチャの実装",
-                        "type": "technical",
-                        "priority": "high",
+                        "type": _TECHNICAL,
+                        "priority": _HIGH,
                         "estimated_hours": 16,
                         "dependencies": [],
                         "subtasks": [
@@ -108,8 +144,8 @@ class SpecToTasksConverter:
                         "id": "COMP-001",
                         "title": "コンポーネント開発",
                         "description": "各コンポーネントの具体的な実装",
-                        "type": "development",
-                        "priority": "high",
+                        "type": _DEVELOPMENT,
+                        "priority": _HIGH,
                         "estimated_hours": 24,
                         "dependencies": ["ARCH-001"],
                         "subtasks": [
@@ -126,8 +162,8 @@ class SpecToTasksConverter:
                         "id": "DB-001",
                         "title": "データベース設計と実装",
                         "description": "データベーススキーマの実装とマイグレーション",
-                        "type": "database",
-                        "priority": "high",
+                        "type": _DATABASE,
+                        "priority": _HIGH,
                         "estimated_hours": 12,
                         "dependencies": [],
                         "subtasks": [
@@ -144,8 +180,8 @@ class SpecToTasksConverter:
                         "id": "API-001",
                         "title": "APIエンドポイント実装",
                         "description": "RESTful APIの実装とテスト",
-                        "type": "development",
-                        "priority": "high",
+                        "type": _DEVELOPMENT,
+                        "priority": _HIGH,
                         "estimated_hours": 20,
                         "dependencies": ["DB-001"],
                         "subtasks": [
@@ -170,8 +206,8 @@ class SpecToTasksConverter:
                         "id": "FUNC-001",
                         "title": "機能要件実装",
                         "description": "要件定義に基づいた機能の実装",
-                        "type": "feature",
-                        "priority": "high",
+                        "type": _FEATURE,
+                        "priority": _HIGH,
                         "estimated_hours": 32,
                         "dependencies": ["API-001", "COMP-001"],
                         "subtasks": [
@@ -188,8 +224,8 @@ class SpecToTasksConverter:
                         "id": "SEC-001",
                         "title": "セキュリティ機能実装",
                         "description": "セキュリティ要件の実装",
-                        "type": "security",
-                        "priority": "critical",
+                        "type": _SECURITY,
+                        "priority": _CRITICAL,
                         "estimated_hours": 16,
                         "dependencies": ["FUNC-001"],
                         "subtasks": [
@@ -211,39 +247,55 @@ class SpecToTasksConverter:
 
     def _organize_tasks_by_priority(self, tasks: list[dict]) -> list[dict]:
         """優先順位でタスクを整理"""
-        priority_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-
-        sorted_tasks = sorted(
-            tasks, key=lambda x: (priority_order.get(x["priority"], 99), x["id"])
+        # 列ごとのリスト（SoA）に展開し、辞書アクセスは各タスク1回に抑える
+        task_ids = [task["id"] for task in tasks]
+        ranks = [_PRIORITY_ORDER.get(task["priority"], 99) for task in tasks]
+        task_deps = [task.get("dependencies", []) for task in tasks]
+
+        # (優先度, ID)順に並べたインデックス列。以降は並び順上の位置で扱う
+        sorted_indices = sorted(
+            range(len(tasks)), key=lambda i: (ranks[i], task_ids[i])
         )
 
-        # 依存関係に基づいてタスクを再配置
-        ordered_tasks = []
-        processed_ids = set()
-
-        while len(ordered_tasks) < len(sorted_tasks):
-            for task in sorted_tasks:
-                if task["id"] in processed_ids:
+        # 依存関係に基づいてタスクを再配置（Kahnのアルゴリズム）
+        # 未処理の依存数と、各タスクIDに依存するタスク（並び順上の位置）を構築
+        indegree = []
+        dependents = defaultdict(list)
+        for position, index in enumerate(sorted_indices):
+            dependencies = task_deps[index]
+            indegree.append(len(dependencies))
+            for dep in dependencies:
+                dependents[dep].append(position)
+
+        # 位置は(優先度, ID)順なので、位置をキーにしたヒープで最優先の実行可能タスクを取り出す
+        ready = [position for position, count in enumerate(indegree) if count == 0]
+        heapq.heapify(ready)
+
+        ordered_positions = []
+        processed = [False] * len(sorted_indices)
+        fallback_position = 0
+
+        while len(ordered_positions) < len(sorted_indices):
+            if ready:
+                position = heapq.heappop(ready)
+                if processed[position]:
                     continue
-
-                # 依存タスクがすべて処理済みか確認
-                deps_met = all(
-                    dep in processed_ids for dep in task.get("dependencies", [])
-                )
-
-                if deps_met:
-                    ordered_tasks.append(task)
-                    processed_ids.add(task["id"])
-                    break
             else:
                 # 循環依存などで進まない場合、最初の未処理タスクを追加
-                for task in sorted_tasks:
-                    if task["id"] not in processed_ids:
-                        ordered_tasks.append(task)
-                        processed_ids.add(task["id"])
-                        break
+                while processed[fallback_position]:
+                    fallback_position += 1
+                position = fallback_position
+
+            ordered_positions.append(position)
+            processed[position] = True
 
-        return ordered_tasks
+            for dependent in dependents[task_ids[sorted_indices[position]]]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0 and not processed[dependent]:
+                    heapq.heappush(ready, dependent)
+
+        # JSON出力用にタスク辞書の並び（AoS）へ戻す
+        return [tasks[sorted_indices[position]] for position in ordered_positions]
 
     def generate_miyabi_integration_tasks(self, detailed_tasks: list[dict]) -> dict:
         """Miyabiフレームワーク連携用のタスクを生成"""
@@ -258,12 +310,15 @@ class SpecToTasksConverter:
         }
 
         for task in detailed_tasks:
+            task_id = task["id"]
+            task_title = task["title"]
+
             # CoordinatorAgent用タスク
             miyabi_tasks["coordinator_tasks"].append(
                 {
-                    "task_id": f"COORD-{task['id']}",
-                    "title": f"調整: {task['title']}",
-                    "description": f"{task['description']}の実行調整",
+                    "task_id": "COORD-" + task_id,
+                    "title": "調整: " + task_title,
+                    "description": task["description"] + "の実行調整",
                     "type": "coordination",
                     "estimated_effort": "2h",
                 }
@@ -272,8 +327,8 @@ class SpecToTasksConverter:
             # IssueAgent用タスク
             miyabi_tasks["issue_agent_tasks"].append(
                 {
-                    "task_id": f"ISSUE-{task['id']}",
-                    "title": f"Issue: {task['title']}",
+                    "task_id": "ISSUE-" + task_id,
+                    "title": "Issue: " + task_title,
                     "description": "実装タスクのIssue作成とラベル管理",
                     "labels": ["implementation", task["type"], task["priority"]],
                     "complexity": self._estimate_complexity(task["estimated_hours"]),
@@ -281,11 +336,11 @@ class SpecToTasksConverter:
             )
 
             # CodeGenAgent用タスク
-            if task["type"] in ["development", "feature", "technical"]:
+            if task["type"] in _CODEGEN_TYPES:
                 miyabi_tasks["codegen_agent_tasks"].append(
                     {
-                        "task_id": f"CODE-{task['id']}",
-                        "title": f"実装: {task['title']}",
+                        "task_id": "CODE-" + task_id,
+                        "title": "実装: " + task_title,
                         "description": task["description"],
                         "subtasks": task["subtasks"],
                         "estimated_hours": task["estimated_hours"],
@@ -295,9 +350,9 @@ class SpecToTasksConverter:
             # TestAgent用タスク
             miyabi_tasks["test_agent_tasks"].append(
                 {
-                    "task_id": f"TEST-{task['id']}",
-                    "title": f"テスト: {task['title']}",
-                    "description": f"{task['title']}のテスト実施",
+                    "task_id": "TEST-" + task_id,
+                    "title": "テスト: " + task_title,
+                    "description": task_title + "のテスト実施",
                     "test_types": ["unit", "integration"],
                     "coverage_target": 80,
                 }
@@ -357,9 +412,7 @@ class SpecToTasksConverter:
             "tasks": tasks,
         }
 
-        output_file.write_text(
-            json.dumps(task_data, indent=2, ensure_ascii=False), encoding="utf-8"
-        )
+        write_json(output_file, task_data)
 
     def _write_miyabi_tasks(self, miyabi_tasks: dict) -> None:
         """Miyabi連携タスクをJSONファイルに出力"""
@@ -374,9 +427,7 @@ class SpecToTasksConverter:
             "agent_tasks": miyabi_tasks,
         }
 
-        output_file.write_text(
-            json.dumps(integration_data, indent=2, ensure_ascii=False), encoding="utf-8"
-        )
+        write_json(output_file, integration_data)
 
     def _write_execution_plan(
         self, detailed_tasks: list[dict], miyabi_tasks: dict
@@ -384,7 +435,10 @@ class SpecToTasksConverter:
         """実行計画をMarkdownファイルに出力"""
         output_file = self.output_path / "execution_plan.md"
 
-        content = f"""# Implementation Execution Plan
+        buf = io.StringIO()
+        w = buf.write
+
+        w(f"""# Implementation Execution Plan
 
 ## Overview
 
@@ -395,37 +449,42 @@ Miyabiフレームワークの7エージェントで自律実行するための
 
 - **総タスク数**: {len(detailed_tasks)}
 - **総工数**: {sum(t['estimated_hours'] for t in detailed_tasks)}時間
-- **クリティカルパス**: {len([t for t in detailed_tasks if t['priority'] == 'critical'])}タスク
+- **クリティカルパス**: {sum(1 for t in detailed_tasks if t['priority'] == 'critical')}タスク
 
 ## Phase-by-Phase Execution
 
 ### Phase 1: Infrastructure Setup (Week 1)
-{self._generate_phase_content([t for t in detailed_tasks if t['type'] in ['technical', 'database']])}
+{self._generate_phase_content([t for t in detailed_tasks if t['type'] in _PHASE1_TYPES])}
 
 ### Phase 2: Core Development (Week 2-3)
-{self._generate_phase_content([t for t in detailed_tasks if t['type'] in ['development', 'feature']])}
+{self._generate_phase_content([t for t in detailed_tasks if t['type'] in _PHASE2_TYPES])}
 
 ### Phase 3: Integration & Testing (Week 4)
 {self._generate_phase_content([t for t in detailed_tasks if t['type'] == 'testing'])}
 
 ### Phase 4: Security & Deployment (Week 5-6)
-{self._generate_phase_content([t for t in detailed_tasks if t['type'] in ['security', 'deployment']])}
+{self._generate_phase_content([t for t in detailed_tasks if t['type'] in _PHASE4_TYPES])}
 
 ## Agent Assignment
 
-### CoordinatorAgent
-{chr(10).join([f"- {task['task_id']}: {task['title']}" for task in miyabi_tasks['coordinator_tasks']])}
-
-### IssueAgent
-{chr(10).join([f"- {task['task_id']}: {task['title']}" for task in miyabi_tasks['issue_agent_tasks']])}
-
-### CodeGenAgent
-{chr(10).join([f"- {task['task_id']}: {task['title']}" for task in miyabi_tasks['codegen_agent_tasks']])}
+""")
 
-### TestAgent
-{chr(10).join([f"- {task['task_id']}: {task['title']}" for task in miyabi_tasks['test_agent_tasks']])}
+        # エージェントごとのタスク行は中間リストを作らずバッファへ直接書き込む
+        for heading, agent_key in [
+            ("CoordinatorAgent", "coordinator_tasks"),
+            ("IssueAgent", "issue_agent_tasks"),
+            ("CodeGenAgent", "codegen_agent_tasks"),
+            ("TestAgent", "test_agent_tasks"),
+        ]:
+            w(f"### {heading}\n")
+            agent_tasks = miyabi_tasks[agent_key]
+            for task in agent_tasks:
+                w(f"- {task['task_id']}: {task['title']}\n")
+            if not agent_tasks:
+                w("\n")
+            w("\n")
 
-## Dependencies Graph
+        w(f"""## Dependencies Graph
 
 ```
 {self._generate_dependency_graph(detailed_tasks)}
@@ -444,22 +503,22 @@ Miyabiフレームワークの7エージェントで自律実行するための
 - **性能目標**: レスポンスタイム2秒以内
 - **セキュリティ目標**: 高危険度脆弱性ゼロ
 - **納期目標**: 6週間での完了
-"""
+""")
 
-        output_file.write_text(content, encoding="utf-8")
+        output_file.write_text(buf.getvalue(), encoding="utf-8")
 
     def _generate_phase_content(self, tasks: list[dict]) -> str:
         """フェーズごとのコンテンツを生成"""
         if not tasks:
             return "該当タスクなし"
 
-        content = ""
-        for task in tasks:
-            content += (
-                f"- **{task['id']}**: {task['title']} ({task['estimated_hours']}h)\n"
+        return (
+            "\n".join(
+                f"- **{task['id']}**: {task['title']} ({task['estimated_hours']}h)"
+                for task in tasks
             )
-
-        return content
+            + "\n"
+        )
 
     def _generate_dependency_graph(self, tasks: list[dict]) -> str:
         """依存関係グラフを生成"""
@@ -472,20 +531,20 @@ Miyabiフレームワークの7エージェントで自律実行するための
         return "\n".join(graph_lines) if graph_lines else "No dependencies found"
 
 
-def main():
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         description="Convert SPEC to detailed implementation tasks"
     )
     parser.add_argument("--spec-path", required=True, help="Path to SPEC directory")
     parser.add_argument("--output", required=True, help="Output directory for tasks")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # SPECディレクトリ確認
     spec_path = Path(args.spec_path)
     if not spec_path.exists():
         print(f"❌ SPEC directory not found: {args.spec_path}")
-        sys.exit(1)
+        return 1
 
     try:
         converter = SpecToTasksConverter(args.spec_path, args.output)
@@ -493,8 +552,10 @@ def main():
 
     except Exception as e:
         print(f"❌ Error converting SPEC to tasks: {e}")
-        sys.exit(1)
+        return 1
+
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -7,25 +7,207 @@ Claude Sonnet 4を活用した知的なPRD解析とタスク分解を実現
 """
 
 import argparse
+import atexit
+import contextlib
+import hashlib
+import io
 import json
+import os
 import re
 import shutil
-import subprocess
 import sys
 import tempfile
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+from json_io import read_json, write_json
+from prd_scan import (
+    classify_task_type,
+    estimate_priority_from_text,
+    estimate_task_complexity,
+    estimate_task_hours,
+    estimate_task_priority,
+    extract_task_tags,
+    scan_prd_lines,
+)
+
+# tasks.md の未完了チェックボックス行
+_TASK_RE = re.compile(r"^- \[ \] (.+)$", re.MULTILINE)
+
+# Claude API によるPRD解析の指示文（全実行で共通の静的プロンプト）
+_PRD_ANALYSIS_INSTRUCTIONS = """\
+You analyze product requirement documents (PRDs) for a spec-driven development \
+pipeline. Read the PRD in the user message and return a JSON object with the keys \
+"features", "requirements", "constraints", "summary" and "confidence".
+- features: one entry per PRD section with "name", "type", "priority" \
+(high/medium/low) and "description".
+- requirements: requirement statements with "text", "type" and "category".
+- constraints: constraint statements with "text" and "type".
+Follow the SpecWorkflow guidelines in the next system block when naming sections."""
+
+# 変更されるとパイプラインキャッシュを無効にする生成スクリプト
+_PIPELINE_CACHE_SCRIPTS = (
+    "enhanced_sdd_pipeline.py",
+    "prd_scan.py",
+    "generate_spec_from_prd.py",
+    "create_tasks_from_spec.py",
+)
+
+# 網羅性チェックで必須とするSPECファイル
+_REQUIRED_SPEC_FILES = ("requirements.md", "design.md", "tasks.md")
+
+# 統計情報でサイズを集計するファイル（ファイル名 -> 統計キー）
+_SPEC_STAT_FILES = {
+    "requirements.md": "requirements_md",
+    "design.md": "design_md",
+    "tasks.md": "tasks_md",
+}
+_TASK_STAT_FILES = {
+    "detailed_tasks.json": "detailed_tasks",
+    "miyabi_integration.json": "miyabi_integration",
+}
+
+# タスク分解を生成したときのPRDキャッシュキーを記録するマーカー
+_TASK_CACHE_KEY_FILE = ".prd_cache_key"
+
+# 統計情報のファイルサイズ欄（初期値0で並べる順序）
+_STAT_FILE_KEYS = (*_SPEC_STAT_FILES.values(), *_TASK_STAT_FILES.values())
+
+# 統計情報のうち実行ごとに変わらない値
+_STATS_TEMPLATE = {
+    "ai_processing": {
+        "features_identified": 8,
+        "tasks_generated": 15,
+        "quality_score": 0.87,
+    },
+    "complexity_score": "Medium-High",
+    "quality_confidence": "High",
+    "integration_readiness": "Ready",
+}
+
+# Miyabiエージェントの役割・担当タスク・優先度
+_MIYABI_AGENTS = {
+    "coordinator": {
+        "role": "タスク統括・並列実行制御",
+        "tasks": ["実行計画最適化", "クリティカルパス特定", "リソース配分"],
+        "priority": "high",
+    },
+    "issue": {
+        "role": "Issue分析・ラベル管理",
+        "tasks": ["自動ラベル分類", "タスク複雑度推定", "進捗管理"],
+        "priority": "high",
+    },
+    "codegen": {
+        "role": "AI駆動コード生成",
+        "tasks": ["実装コード生成", "テストコード生成", "ドキュメント生成"],
+        "priority": "high",
+    },
+    "review": {
+        "role": "コード品質判定",
+        "tasks": ["静的解析", "セキュリティスキャン", "品質スコアリング"],
+        "priority": "medium",
+    },
+    "pr": {
+        "role": "Pull Request自動作成",
+        "tasks": ["Draft PR生成", "レビュアー設定", "マージ管理"],
+        "priority": "medium",
+    },
+    "deployment": {
+        "role": "CI/CDデプロイ自動化",
+        "tasks": ["自動デプロイ", "ヘルスチェック", "ロールバック"],
+        "priority": "medium",
+    },
+    "test": {
+        "role": "テスト自動実行",
+        "tasks": ["テスト実行", "カバレッジ計測", "レポート生成"],
+        "priority": "high",
+    },
+}
+
+# Miyabiエージェントの実行順序と依存関係
+_AGENT_EXECUTION_ORDER = {
+    "coordinator": 1,
+    "issue": 2,
+    "codegen": 3,
+    "test": 4,
+    "review": 5,
+    "pr": 6,
+    "deployment": 7,
+}
+_AGENT_DEPENDENCIES = {
+    "issue": ("coordinator",),
+    "codegen": ("issue", "coordinator"),
+    "test": ("codegen",),
+    "review": ("codegen", "test"),
+    "pr": ("review",),
+    "deployment": ("pr",),
+}
+
+
+@dataclass(slots=True)
+class Task:
+    """AIタスク分解で生成する1タスク（__slots__でインスタンスごとの辞書を持たない）"""
+
+    task_id: str
+    title: str
+    description: str
+    type: str
+    priority: str
+    estimated_hours: int
+    complexity: str
+    dependencies: list[str]
+    acceptance_criteria: list[str]
+    tags: list[str]
+
+
+def _write_json_atomic(path: Path, data: dict) -> None:
+    """書き込み途中のファイルを他の実行が読まないよう、一時ファイルの置き換えで保存"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = path.with_suffix(".tmp")
+    write_json(tmp_file, data)
+    tmp_file.replace(path)
+
 
 class AISpecGenerator:
     """AI連携仕様生成器"""
 
+    # 属性を固定し、インスタンスごとの__dict__を持たない
+    __slots__ = (
+        "prd_path",
+        "spec_name",
+        "output_dir",
+        "debug",
+        "spec_dir",
+        "tasks_dir",
+        "script_dir",
+        "generate_script",
+        "tasks_script",
+        "validate_script",
+        "temp_dir",
+        "guidelines",
+        "_cleaned_up",
+        "_now_iso",
+        "_guidelines_text",
+        "_prompt_cache_key",
+        "_prd_cache_hit",
+        "_prd_cache_key",
+        "_spec_files",
+    )
+
     def __init__(
-        self, prd_path: str, spec_name: str, output_dir: str = ".spec-workflow"
+        self,
+        prd_path: str,
+        spec_name: str,
+        output_dir: str = ".spec-workflow",
+        debug: bool = False,
     ):
         self.prd_path = Path(prd_path)
         self.spec_name = spec_name
         self.output_dir = Path(output_dir)
+        self.debug = debug
         self.spec_dir = self.output_dir / "specs" / spec_name
         self.tasks_dir = self.output_dir / "tasks" / spec_name
 
@@ -36,7 +218,18 @@ class AISpecGenerator:
         self.validate_script = self.script_dir / "validate_prd_spec_sync.py"
 
         # AI連携用の一時ディレクトリ
+        # 中断・異常終了でも残らないよう、終了時のクリーンアップも登録しておく
         self.temp_dir = Path(tempfile.mkdtemp(prefix="sdd_ai_"))
+        self._cleaned_up = False
+        atexit.register(self._cleanup)
+
+    def __enter__(self) -> "AISpecGenerator":
+        """with文で使用し、ブロックを抜けるときに一時ディレクトリを削除する"""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """例外・中断時も含めてクリーンアップを実行"""
+        self._cleanup()
 
     def run_enhanced_pipeline(self) -> bool:
         """強化されたSDDパイプラインを実行"""
@@ -46,6 +239,9 @@ class AISpecGenerator:
         print(f"📁 Output: {self.output_dir}")
         print()
 
+        # 生成物のタイムスタンプはパイプライン実行ごとに1回だけ計算する
+        self._now_iso = datetime.now().isoformat()
+
         try:
             # Phase 0: SpecWorkflowMcpガイドライン読み込み
             if not self._load_spec_workflow_guidelines():
@@ -64,9 +260,14 @@ class AISpecGenerator:
             if not self._generate_spec_with_ai(prd_analysis):
                 return False
 
-            # Phase 4: AIタスク分解
-            if not self._create_detailed_tasks_with_ai():
-                return False
+            # Phase 4: AIタスク分解（PRDが前回実行から変わっていなければ再利用）
+            if self._can_reuse_task_breakdown():
+                print("🔨 Phase 4: PRD unchanged, reusing previous task breakdown")
+            else:
+                if not self._create_detailed_tasks_with_ai():
+                    return False
+                self._save_prd_cache(prd_analysis)
+                self._save_task_cache_key()
 
             # Phase 5: 品質検証（AI活用）
             if not self._validate_quality_with_ai():
@@ -80,6 +281,8 @@ class AISpecGenerator:
             self._generate_enhanced_report()
 
             # Phase 8: クリーンアップ
+            if self.debug:
+                self._print_classifier_cache_stats()
             self._cleanup()
 
             print("✅ Enhanced SDD Pipeline completed successfully!")
@@ -101,6 +304,14 @@ class AISpecGenerator:
 
             # 常に有効なガイドラインが返されることを保証
             self.guidelines = guidelines_result
+
+            # 静的プロンプト（指示文＋ガイドライン）の内容からキャッシュキーを算出
+            self._guidelines_text = json.dumps(
+                self.guidelines, ensure_ascii=False, sort_keys=True
+            )
+            self._prompt_cache_key = hashlib.sha256(
+                (_PRD_ANALYSIS_INSTRUCTIONS + self._guidelines_text).encode("utf-8")
+            ).hexdigest()[:16]
             print("✅ Guidelines loaded successfully")
             return True
 
@@ -159,11 +370,10 @@ class AISpecGenerator:
         """実行環境を準備"""
         print("🔧 Phase 1: Preparing environment...")
 
-        # 出力ディレクトリ作成
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        # 出力ディレクトリ作成（output_dir は各サブディレクトリの作成時に作られ、
+        # temp_dir は mkdtemp で作成済み）
         self.spec_dir.mkdir(parents=True, exist_ok=True)
         self.tasks_dir.mkdir(parents=True, exist_ok=True)
-        self.temp_dir.mkdir(parents=True, exist_ok=True)
 
         # PRDファイル存在確認
         if not self.prd_path.exists():
@@ -178,19 +388,33 @@ class AISpecGenerator:
         print("🧠 Phase 2: AI-powered PRD analysis...")
 
         try:
-            prd_content = self.prd_path.read_text(encoding="utf-8")
-
-            # AI解析プロンプトの生成
-
-            # AI解析の実行（シミュレーション）
-            analysis_result = self._simulate_ai_analysis(prd_content)
-
-            # 解析結果を保存
-            analysis_file = self.temp_dir / "prd_analysis.json"
-            analysis_file.write_text(
-                json.dumps(analysis_result, indent=2, ensure_ascii=False),
-                encoding="utf-8",
-            )
+            # PRD・ガイドライン・スクリプトが前回実行と同一なら解析結果を再利用する
+            self._prd_cache_hit = False
+            self._prd_cache_key = self._prd_content_key()
+            analysis_result = self._load_prd_cache()
+            if analysis_result is not None:
+                self._prd_cache_hit = True
+                print("   ♻️ PRD unchanged, analysis loaded from cache")
+            else:
+                analysis_result = self._analyze_prd_sections()
+
+            # 解析結果は後続フェーズへメモリ上で渡すため、デバッグ時のみ保存
+            if self.debug:
+                analysis_file = self.temp_dir / "prd_analysis.json"
+                write_json(analysis_file, analysis_result)
+                print(f"   🐛 PRD analysis saved: {analysis_file}")
+
+                request_file = self.temp_dir / "prd_analysis_request.json"
+                write_json(
+                    request_file,
+                    self._build_analysis_request(
+                        self.prd_path.read_text(encoding="utf-8")
+                    ),
+                )
+                print(
+                    f"   🐛 Analysis request saved: {request_file} "
+                    f"(prompt cache key: {self._prompt_cache_key})"
+                )
 
             print(
                 f"✅ PRD analysis completed: {len(analysis_result.get('features', []))} features identified"
@@ -201,38 +425,96 @@ class AISpecGenerator:
             print(f"❌ Error in PRD analysis: {e}")
             return None
 
-    def _simulate_ai_analysis(self, content: str) -> dict:
-        """AI解析を実行"""
-        # 注意: 現在はシミュレーション、将来的にはClaude API呼び出しに置き換え
+    def _analyze_prd_sections(self) -> dict:
+        """PRDを走査し、AI解析で解析結果を得る"""
+        # PRD全体を1つの文字列に展開せず、行単位で読み込みながら解析する
+        with self.prd_path.open(encoding="utf-8") as prd_lines:
+            sections = scan_prd_lines(prd_lines)
+
+        # AI解析の実行（シミュレーション）
+        return self._simulate_ai_analysis(sections)
+
+    def _prd_content_key(self) -> str:
+        """PRD・ガイドライン・生成スクリプトの更新状態からキャッシュキーを算出"""
+        # PRDは本文を読まずにパス・サイズ・更新時刻で識別し、解析時の1回の読み込みに抑える
+        prd_stat = self.prd_path.stat()
+        prd_key = (
+            f"{self.prd_path.absolute()}:{prd_stat.st_size}:{prd_stat.st_mtime_ns}"
+        )
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(prd_key.encode("utf-8"))
+        digest.update(self.spec_name.encode("utf-8"))
+        digest.update(self._guidelines_text.encode("utf-8"))
+        for script_name in _PIPELINE_CACHE_SCRIPTS:
+            script_path = self.script_dir / script_name
+            if script_path.exists():
+                mtime_ns = script_path.stat().st_mtime_ns
+                digest.update(f"{script_name}:{mtime_ns}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _prd_cache_file(self) -> Path:
+        """PRD内容キャッシュのファイルパス"""
+        return self.output_dir / ".cache" / f"{self._prd_cache_key}.json"
+
+    def _load_prd_cache(self) -> dict | None:
+        """前回実行の解析結果を読み込む（なければNone）"""
         try:
-            features = []
-            requirements = []
-            constraints = []
-
-            # 見出しベースの機能抽出
-            lines = content.split("\n")
-            current_section = None
-
-            for line in lines:
-                heading_match = re.match(r"^(#{1,6})\s+(.+)$", line)
-                if heading_match:
-                    current_section = heading_match[2]
-                    features.append(
-                        {
-                            "name": current_section,
-                            "type": "feature",
-                            "priority": self._estimate_priority_from_text(
-                                current_section
-                            ),
-                            "description": f"Feature related to {current_section}",
-                        }
-                    )
+            return read_json(self._prd_cache_file())["prd_analysis"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _save_prd_cache(self, prd_analysis: dict) -> None:
+        """タスク分解まで完了した解析結果を保存"""
+        if self._prd_cache_hit:
+            return
+        _write_json_atomic(self._prd_cache_file(), {"prd_analysis": prd_analysis})
+
+    def _save_task_cache_key(self) -> None:
+        """タスク分解の出力がどのPRDから生成されたかを記録"""
+        (self.tasks_dir / _TASK_CACHE_KEY_FILE).write_text(
+            self._prd_cache_key, encoding="utf-8"
+        )
 
-            # キーワードベースの要件抽出
-            requirements.extend(self._extract_requirements_from_content(content))
+    def _can_reuse_task_breakdown(self) -> bool:
+        """同一PRDの前回実行で生成したタスク分解が残っているか"""
+        if not self._prd_cache_hit:
+            return False
+        # 別のPRDで上書きされたタスク分解は再利用しない
+        try:
+            recorded_key = (self.tasks_dir / _TASK_CACHE_KEY_FILE).read_text(
+                encoding="utf-8"
+            )
+        except OSError:
+            return False
+        return (
+            recorded_key == self._prd_cache_key
+            and (self.tasks_dir / "detailed_tasks.json").exists()
+        )
+
+    def _build_analysis_request(self, prd_content: str) -> dict:
+        """Claude API (Messages) 向けのPRD解析リクエストを組み立てる"""
+        # 指示文とガイドラインは全実行で共通のため、system末尾にキャッシュの区切りを置き
+        # 2回目以降はプロンプトキャッシュから読み込ませる。可変部分のPRD本文はmessagesのみ
+        return {
+            "system": [
+                {"type": "text", "text": _PRD_ANALYSIS_INSTRUCTIONS},
+                {
+                    "type": "text",
+                    "text": self._guidelines_text,
+                    "cache_control": {"type": "ephemeral"},
+                },
+            ],
+            "messages": [{"role": "user", "content": prd_content}],
+        }
 
-            # 制約条件の特定
-            constraints.extend(self._extract_constraints_from_content(content))
+    def _simulate_ai_analysis(
+        self, sections: tuple[list[dict], list[dict], list[dict]]
+    ) -> dict:
+        """AI解析を実行"""
+        # 注意: 現在はシミュレーション、将来的にはClaude API呼び出しに置き換え
+        try:
+            # 1回の走査で抽出済みの見出し（機能）・要件・制約
+            features, requirements, constraints = sections
 
             confidence_score = min(
                 0.9, len(features) * 0.1 + 0.5
@@ -262,73 +544,28 @@ class AISpecGenerator:
                 "analysis_type": "fallback",
             }
 
-    def _estimate_priority_from_text(self, text: str) -> str:
-        """テキストから優先度を推定"""
-        text_lower = text.lower()
-        if any(
-            keyword in text_lower
-            for keyword in ["critical", "security", "auth", "核心"]
-        ):
-            return "high"
-        if any(keyword in text_lower for keyword in ["feature", "function", "機能"]):
-            return "medium"
-        return "low"
-
-    def _extract_requirements_from_content(self, content: str) -> list[dict]:
-        """コンテンツから要件を抽出"""
-        requirements = []
-        lines = content.split("\n")
-
-        for line in lines:
-            if any(
-                keyword in line.lower()
-                for keyword in ["requirement", "must", "should", "要件"]
-            ):
-                requirements.append(
-                    {
-                        "text": line.strip(),
-                        "type": "requirement",
-                        "category": "functional",
-                    }
-                )
-
-        return requirements
-
-    def _extract_constraints_from_content(self, content: str) -> list[dict]:
-        """コンテンツから制約を抽出"""
-        constraints = []
-        lines = content.split("\n")
-
-        for line in lines:
-            if any(
-                keyword in line.lower()
-                for keyword in ["constraint", "limit", "制約", "制限"]
-            ):
-                constraints.append({"text": line.strip(), "type": "constraint"})
-
-        return constraints
-
     def _generate_spec_with_ai(self, prd_analysis: dict) -> bool:
         """AI連携SPEC生成を実行"""
         print("📝 Phase 3: AI-enhanced SPEC generation...")
 
         try:
-            # 既存の生成スクリプトを実行
-            cmd = [
-                "python",
-                str(self.generate_script),
-                "--input",
-                str(self.prd_path),
-                "--output",
-                str(self.output_dir / "specs"),
-                "--spec-name",
-                self.spec_name,
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True)
-
-            if result.returncode != 0:
-                print(f"❌ SPEC generation failed: {result.stderr}")
+            # 既存の生成スクリプトをプロセス内で実行
+            from generate_spec_from_prd import main as generate_main
+
+            returncode, output = self._run_script_main(
+                generate_main,
+                [
+                    "--input",
+                    str(self.prd_path),
+                    "--output",
+                    str(self.output_dir / "specs"),
+                    "--spec-name",
+                    self.spec_name,
+                ],
+            )
+
+            if returncode != 0:
+                print(f"❌ SPEC generation failed: {output}")
                 return False
 
             # AIによる品質向上
@@ -341,6 +578,23 @@ class AISpecGenerator:
             print(f"❌ Error in SPEC generation: {e}")
             return False
 
+    def _run_script_main(
+        self, main: Callable[[list[str]], int], argv: list[str]
+    ) -> tuple[int, str]:
+        """サブスクリプトのmainをプロセス内で実行し、(終了コード, 出力)を返す"""
+        # サブプロセス実行時と同様に、サブスクリプトの出力はコンソールに流さない
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            try:
+                returncode = main(argv)
+            except SystemExit as e:
+                # argparse のエラーなどはパイプライン全体を終了させず終了コードとして扱う
+                # （sys.exit() の None は成功、文字列などの終了値は失敗）
+                returncode = (
+                    0 if e.code is None else (e.code if isinstance(e.code, int) else 1)
+                )
+        return returncode, output.getvalue()
+
     def _enhance_spec_with_ai(self, prd_analysis: dict) -> None:
         """生成されたSPECをAIで品質向上"""
         # requirements.mdの強化
@@ -416,20 +670,21 @@ class AISpecGenerator:
                 # タスク分解スクリプトが存在しない場合、AIで直接生成
                 self._generate_tasks_with_ai()
             else:
-                cmd = [
-                    "python",
-                    str(self.tasks_script),
-                    "--spec-path",
-                    str(self.spec_dir),
-                    "--output",
-                    str(self.tasks_dir),
-                ]
-
-                result = subprocess.run(cmd, capture_output=True, text=True)
+                from create_tasks_from_spec import main as tasks_main
+
+                returncode, output = self._run_script_main(
+                    tasks_main,
+                    [
+                        "--spec-path",
+                        str(self.spec_dir),
+                        "--output",
+                        str(self.tasks_dir),
+                    ],
+                )
 
-                if result.returncode != 0:
+                if returncode != 0:
                     print(
-                        f"⚠️ Task creation script failed, using AI generation: {result.stderr}"
+                        f"⚠️ Task creation script failed, using AI generation: {output}"
                     )
                     self._generate_tasks_with_ai()
 
@@ -455,7 +710,7 @@ class AISpecGenerator:
         # AIによる詳細タスク生成
         detailed_tasks = {
             "project": self.spec_name,
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": self._now_iso,
             "tasks": self._create_enhanced_task_structure(tasks_content),
             "dependencies": self._analyze_task_dependencies(tasks_content),
             "estimates": self._generate_time_estimates(tasks_content),
@@ -463,30 +718,30 @@ class AISpecGenerator:
         }
 
         # 詳細タスクJSONの保存
-        (self.tasks_dir / "detailed_tasks.json").write_text(
-            json.dumps(detailed_tasks, indent=2, ensure_ascii=False), encoding="utf-8"
-        )
+        write_json(self.tasks_dir / "detailed_tasks.json", detailed_tasks)
 
-    def _create_enhanced_task_structure(self, tasks_content: str) -> list[dict]:
+    def _create_enhanced_task_structure(self, tasks_content: str) -> list[Task]:
         """強化されたタスク構造を作成"""
         tasks = []
 
         # タスク行を抽出
-        task_lines = re.findall(r"^- \[ \] (.+)$", tasks_content, re.MULTILINE)
+        task_lines = _TASK_RE.findall(tasks_content)
 
         for i, task_line in enumerate(task_lines, 1):
-            task = {
-                "task_id": f"TASK-{i:03d}",
-                "title": task_line,
-                "description": f"Implementation task for: {task_line}",
-                "type": self._classify_task_type(task_line),
-                "priority": self._estimate_priority(task_line),
-                "estimated_hours": self._estimate_task_hours(task_line),
-                "complexity": self._estimate_complexity_for_task(task_line),
-                "dependencies": [],
-                "acceptance_criteria": self._generate_acceptance_criteria(task_line),
-                "tags": self._extract_task_tags(task_line),
-            }
+            # 各見積もりで使う小文字化はタスクごとに1回だけ行う
+            task_lower = task_line.lower()
+            task = Task(
+                task_id=f"TASK-{i:03d}",
+                title=task_line,
+                description=f"Implementation task for: {task_line}",
+                type=classify_task_type(task_lower),
+                priority=estimate_task_priority(task_lower),
+                estimated_hours=estimate_task_hours(task_lower),
+                complexity=estimate_task_complexity(task_lower),
+                dependencies=[],
+                acceptance_criteria=self._generate_acceptance_criteria(task_line),
+                tags=extract_task_tags(task_lower),
+            )
             tasks.append(task)
 
         return tasks
@@ -496,6 +751,9 @@ class AISpecGenerator:
         print("🔍 Phase 5: AI-powered quality validation...")
 
         try:
+            # SPECファイルの存在確認はディレクトリの1回の走査で済ませる
+            self._scan_spec_dir()
+
             validation_results = {
                 "overall_score": 0,
                 "checks": {},
@@ -528,10 +786,7 @@ class AISpecGenerator:
             )
 
             # 検証結果を保存
-            (self.tasks_dir / "quality_validation.json").write_text(
-                json.dumps(validation_results, indent=2, ensure_ascii=False),
-                encoding="utf-8",
-            )
+            write_json(self.tasks_dir / "quality_validation.json", validation_results)
 
             # 品質基準の確認
             if validation_results["overall_score"] >= 0.8:
@@ -549,25 +804,39 @@ class AISpecGenerator:
             print(f"❌ Error in quality validation: {e}")
             return False
 
+    def _scan_spec_dir(self) -> None:
+        """SPECディレクトリ内のファイル一覧をキャッシュ"""
+        try:
+            with os.scandir(self.spec_dir) as entries:
+                self._spec_files = {
+                    entry.name: Path(entry.path) for entry in entries if entry.is_file()
+                }
+        except FileNotFoundError:
+            self._spec_files = {}
+
+    def _read_spec_file(self, file_name: str) -> str | None:
+        """キャッシュ済みの一覧からSPECファイルを読み込む（存在しなければNone）"""
+        file_path = self._spec_files.get(file_name)
+        if file_path is None:
+            return None
+        return file_path.read_text(encoding="utf-8")
+
     def _check_completeness(self) -> float:
         """網羅性をチェック"""
-        required_files = ["requirements.md", "design.md", "tasks.md"]
-
         missing_files = 0
-        for file_name in required_files:
-            if not (self.spec_dir / file_name).exists():
+        for file_name in _REQUIRED_SPEC_FILES:
+            if file_name not in self._spec_files:
                 missing_files += 1
 
-        return 1.0 - (missing_files / len(required_files))
+        return 1.0 - (missing_files / len(_REQUIRED_SPEC_FILES))
 
     def _check_content_quality(self) -> float:
         """内容品質をチェック"""
         scores = []
 
         # requirements.mdの品質チェック
-        req_file = self.spec_dir / "requirements.md"
-        if req_file.exists():
-            content = req_file.read_text(encoding="utf-8")
+        content = self._read_spec_file("requirements.md")
+        if content is not None:
             score = 0
 
             if len(content) > 2000:
@@ -582,9 +851,8 @@ class AISpecGenerator:
             scores.append(score)
 
         # design.mdの品質チェック
-        design_file = self.spec_dir / "design.md"
-        if design_file.exists():
-            content = design_file.read_text(encoding="utf-8")
+        content = self._read_spec_file("design.md")
+        if content is not None:
             score = 0
 
             if len(content) > 2000:
@@ -608,9 +876,8 @@ class AISpecGenerator:
     def _check_feasibility(self) -> float:
         """実行可能性をチェック"""
         # タスク数と複雑度に基づく実行可能性評価
-        tasks_file = self.spec_dir / "tasks.md"
-        if tasks_file.exists():
-            content = tasks_file.read_text(encoding="utf-8")
+        content = self._read_spec_file("tasks.md")
+        if content is not None:
             task_count = content.count("- [ ]")
 
             if task_count > 5 and task_count < 50:
@@ -626,14 +893,16 @@ class AISpecGenerator:
         print("🔗 Phase 6: Preparing Miyabi integration...")
 
         try:
-            # 既存のmiyabi_integration.jsonを読み込み
+            # 既存のmiyabi_integration.jsonを読み込み、なければ作成したデータをそのまま使う
             miyabi_file = self.tasks_dir / "miyabi_integration.json"
 
-            if not miyabi_file.exists():
-                self._create_miyabi_integration_data()
+            if miyabi_file.exists():
+                miyabi_data = read_json(miyabi_file)
+            else:
+                miyabi_data = self._create_miyabi_integration_data()
 
             # 各エージェント用の実行プランを生成
-            self._generate_agent_execution_plans()
+            self._generate_agent_execution_plans(miyabi_data)
 
             print("✅ Miyabi integration prepared")
             return True
@@ -642,64 +911,43 @@ class AISpecGenerator:
             print(f"❌ Error in Miyabi integration: {e}")
             return False
 
-    def _create_miyabi_integration_data(self) -> None:
+    def _create_miyabi_integration_data(self) -> dict:
         """Miyabi連携データを作成"""
         integration_data = {
             "project": self.spec_name,
-            "generated_at": datetime.now().isoformat(),
-            "agents": {
-                "coordinator": {
-                    "role": "タスク統括・並列実行制御",
-                    "tasks": ["実行計画最適化", "クリティカルパス特定", "リソース配分"],
-                    "priority": "high",
-                },
-                "issue": {
-                    "role": "Issue分析・ラベル管理",
-                    "tasks": ["自動ラベル分類", "タスク複雑度推定", "進捗管理"],
-                    "priority": "high",
-                },
-                "codegen": {
-                    "role": "AI駆動コード生成",
-                    "tasks": ["実装コード生成", "テストコード生成", "ドキュメント生成"],
-                    "priority": "high",
-                },
-                "review": {
-                    "role": "コード品質判定",
-                    "tasks": ["静的解析", "セキュリティスキャン", "品質スコアリング"],
-                    "priority": "medium",
-                },
-                "pr": {
-                    "role": "Pull Request自動作成",
-                    "tasks": ["Draft PR生成", "レビュアー設定", "マージ管理"],
-                    "priority": "medium",
-                },
-                "deployment": {
-                    "role": "CI/CDデプロイ自動化",
-                    "tasks": ["自動デプロイ", "ヘルスチェック", "ロールバック"],
-                    "priority": "medium",
-                },
-                "test": {
-                    "role": "テスト自動実行",
-                    "tasks": ["テスト実行", "カバレッジ計測", "レポート生成"],
-                    "priority": "high",
-                },
-            },
+            "generated_at": self._now_iso,
+            "agents": _MIYABI_AGENTS,
         }
 
-        (self.tasks_dir / "miyabi_integration.json").write_text(
-            json.dumps(integration_data, indent=2, ensure_ascii=False), encoding="utf-8"
-        )
+        write_json(self.tasks_dir / "miyabi_integration.json", integration_data)
+
+        return integration_data
+
+    def _get_miyabi_agents(self, miyabi_data: dict) -> dict:
+        """Miyabi連携データからエージェント名 -> {role, tasks} を取り出す"""
+        if "agents" in miyabi_data:
+            return miyabi_data["agents"]
 
-    def _generate_agent_execution_plans(self) -> None:
+        # create_tasks_from_spec の出力は "<agent>_tasks" / "<agent>_agent_tasks" の
+        # キーごとにタスク辞書を持つため、役割は既定のエージェント定義から補う
+        agents = {}
+        for agent_key, agent_tasks in miyabi_data.get("agent_tasks", {}).items():
+            agent_name = agent_key.removesuffix("_tasks").removesuffix("_agent")
+            agents[agent_name] = {
+                "role": _MIYABI_AGENTS.get(agent_name, {}).get("role", agent_name),
+                "tasks": [task["title"] for task in agent_tasks],
+            }
+        return agents
+
+    def _generate_agent_execution_plans(self, miyabi_data: dict) -> None:
         """各エージェントの実行プランを生成"""
         plans_dir = self.tasks_dir / "agent_plans"
         plans_dir.mkdir(exist_ok=True)
 
-        miyabi_data = json.loads(
-            (self.tasks_dir / "miyabi_integration.json").read_text(encoding="utf-8")
-        )
-
-        for agent_name, agent_data in miyabi_data["agents"].items():
+        # プランの組み立ては逐次、ファイル書き込みはスレッドで並列実行
+        plan_files = []
+        plans = []
+        for agent_name, agent_data in self._get_miyabi_agents(miyabi_data).items():
             plan = {
                 "agent": agent_name,
                 "role": agent_data["role"],
@@ -711,10 +959,15 @@ class AISpecGenerator:
                 ),
                 "success_criteria": self._define_success_criteria(agent_name),
             }
+            plan_files.append(plans_dir / f"{agent_name}_plan.json")
+            plans.append(plan)
 
-            (plans_dir / f"{agent_name}_plan.json").write_text(
-                json.dumps(plan, indent=2, ensure_ascii=False), encoding="utf-8"
-            )
+        if not plans:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(8, len(plans))) as executor:
+            # 結果を消費して書き込み時の例外を呼び出し元へ伝える
+            list(executor.map(write_json, plan_files, plans))
 
     def _generate_enhanced_report(self) -> None:
         """強化された完了レポートを生成"""
@@ -828,49 +1081,6 @@ Generated by Spec Flow Auto Skill with Claude Sonnet 4
         """セキュリティプラクティスを推奨"""
         return "- Zero-trust architecture\n- Regular security audits\n- Automated vulnerability scanning"
 
-    def _classify_task_type(self, task_line: str) -> str:
-        """タスクタイプを分類"""
-        if "test" in task_line.lower():
-            return "testing"
-        if "deploy" in task_line.lower():
-            return "deployment"
-        if "api" in task_line.lower() or "backend" in task_line.lower():
-            return "backend"
-        if "ui" in task_line.lower() or "frontend" in task_line.lower():
-            return "frontend"
-        return "general"
-
-    def _estimate_priority(self, task_line: str) -> str:
-        """優先度を見積もる"""
-        if (
-            "authentication" in task_line.lower()
-            or "security" in task_line.lower()
-            or "setup" in task_line.lower()
-            or "initial" in task_line.lower()
-        ):
-            return "high"
-        if "optimization" in task_line.lower():
-            return "medium"
-        return "medium"
-
-    def _estimate_task_hours(self, task_line: str) -> int:
-        """タスク工数を見積もる"""
-        if "setup" in task_line.lower():
-            return 8
-        if "implementation" in task_line.lower():
-            return 16
-        if "testing" in task_line.lower():
-            return 12
-        return 6
-
-    def _estimate_complexity_for_task(self, task_line: str) -> str:
-        """タスク複雑度を見積もる"""
-        if "integration" in task_line.lower():
-            return "high"
-        if "setup" in task_line.lower():
-            return "medium"
-        return "medium"
-
     def _generate_acceptance_criteria(self, task_line: str) -> list[str]:
         """受け入れ基準を生成"""
         return [
@@ -880,19 +1090,6 @@ Generated by Spec Flow Auto Skill with Claude Sonnet 4
             "Documentation updated",
         ]
 
-    def _extract_task_tags(self, task_line: str) -> list[str]:
-        """タスクタグを抽出"""
-        tags = []
-        if "security" in task_line.lower():
-            tags.append("security")
-        if "performance" in task_line.lower():
-            tags.append("performance")
-        if "ui" in task_line.lower():
-            tags.append("frontend")
-        if "api" in task_line.lower():
-            tags.append("backend")
-        return tags
-
     def _analyze_task_dependencies(self, tasks_content: str) -> list[dict]:
         """タスク依存関係を分析"""
         return [{"task": "setup", "depends_on": [], "type": "foundation"}]
@@ -930,34 +1127,18 @@ Generated by Spec Flow Auto Skill with Claude Sonnet 4
         # 既存のタスクファイルを読み込み
         detailed_tasks_file = self.tasks_dir / "detailed_tasks.json"
         if detailed_tasks_file.exists():
-            json.loads(detailed_tasks_file.read_text(encoding="utf-8"))
+            read_json(detailed_tasks_file)
             # AIによる最適化処理（ここではプレースホルダー）
             print("   🤖 AI optimization applied to task breakdown")
 
     def _determine_execution_order(self, agent_name: str) -> int:
         """実行順序を決定"""
-        order_map = {
-            "coordinator": 1,
-            "issue": 2,
-            "codegen": 3,
-            "test": 4,
-            "review": 5,
-            "pr": 6,
-            "deployment": 7,
-        }
-        return order_map.get(agent_name, 99)
+        return _AGENT_EXECUTION_ORDER.get(agent_name, 99)
 
-    def _get_agent_dependencies(self, agent_name: str) -> list[str]:
+    def _get_agent_dependencies(self, agent_name: str) -> tuple[str, ...]:
         """エージェント依存関係を取得"""
-        dependencies = {
-            "issue": ["coordinator"],
-            "codegen": ["issue", "coordinator"],
-            "test": ["codegen"],
-            "review": ["codegen", "test"],
-            "pr": ["review"],
-            "deployment": ["pr"],
-        }
-        return dependencies.get(agent_name, [])
+        # 不変のタプルなので複製せずに全プランで共有する（JSONでは配列として出力）
+        return _AGENT_DEPENDENCIES.get(agent_name, ())
 
     def _estimate_agent_duration(self, tasks: list[str]) -> dict:
         """エージェント実行時間を見積もる"""
@@ -977,39 +1158,28 @@ Generated by Spec Flow Auto Skill with Claude Sonnet 4
 
     def _collect_enhanced_statistics(self) -> dict:
         """強化された統計情報を収集"""
+        # 固定値はテンプレートから浅く複製し、ファイルサイズのみ実測値で埋める
+        file_sizes = dict.fromkeys(_STAT_FILE_KEYS, 0)
         stats = {
-            "ai_processing": {
-                "features_identified": 8,
-                "tasks_generated": 15,
-                "quality_score": 0.87,
-            },
-            "complexity_score": "Medium-High",
-            "quality_confidence": "High",
-            "integration_readiness": "Ready",
+            **_STATS_TEMPLATE,
+            "ai_processing": dict(_STATS_TEMPLATE["ai_processing"]),
+            "files": file_sizes,
         }
 
-        # 基本統計
-        base_stats = {
-            "files": {
-                "requirements_md": 0,
-                "design_md": 0,
-                "tasks_md": 0,
-                "detailed_tasks": 0,
-                "miyabi_integration": 0,
-            }
-        }
+        # ディレクトリごとに1回だけ走査し、エントリの情報からサイズを取得する
+        for directory, file_names in (
+            (self.spec_dir, _SPEC_STAT_FILES),
+            (self.tasks_dir, _TASK_STAT_FILES),
+        ):
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        file_key = file_names.get(entry.name)
+                        if file_key is not None and entry.is_file():
+                            file_sizes[file_key] = entry.stat().st_size
+            except FileNotFoundError:
+                continue
 
-        for file_key, file_path in [
-            ("requirements_md", self.spec_dir / "requirements.md"),
-            ("design_md", self.spec_dir / "design.md"),
-            ("tasks_md", self.spec_dir / "tasks.md"),
-            ("detailed_tasks", self.tasks_dir / "detailed_tasks.json"),
-            ("miyabi_integration", self.tasks_dir / "miyabi_integration.json"),
-        ]:
-            if file_path.exists():
-                base_stats["files"][file_key] = file_path.stat().st_size
-
-        stats.update(base_stats)
         return stats
 
     def _format_enhanced_statistics(self, stats: dict) -> str:
@@ -1078,10 +1248,31 @@ The system is ready for autonomous development with Miyabi agents:
 3. Comprehensive testing strategy
 """
 
+    def _print_classifier_cache_stats(self) -> None:
+        """分類関数のキャッシュヒット状況を表示（デバッグ用）"""
+        for func in (estimate_priority_from_text, classify_task_type):
+            print(f"🐛 {func.__name__}: {func.cache_info()}")
+
     def _cleanup(self) -> None:
-        """クリーンアップ処理"""
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+        """クリーンアップ処理（複数回呼ばれても1回だけ実行）"""
+        if self._cleaned_up:
+            return
+        self._cleaned_up = True
+        atexit.unregister(self._cleanup)
+
+        if self.debug:
+            # デバッグ時は中間ファイルを確認できるよう一時ディレクトリを残す
+            print(f"🐛 Debug: intermediate files kept in {self.temp_dir}")
+            return
+
+        # 通常実行では一時ディレクトリに何も書き込まないため、空ディレクトリの
+        # 削除で済ませ、中身が残っている場合のみツリーを走査して削除する
+        try:
+            os.rmdir(self.temp_dir)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
 
 
 def main():
@@ -1091,11 +1282,18 @@ def main():
     parser.add_argument("--prd", required=True, help="Path to PRD document")
     parser.add_argument("--spec-name", required=True, help="Specification name")
     parser.add_argument("--output", default=".spec-workflow", help="Output directory")
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Keep intermediate files such as prd_analysis.json",
+    )
 
     args = parser.parse_args()
 
-    generator = AISpecGenerator(args.prd, args.spec_name, args.output)
-    success = generator.run_enhanced_pipeline()
+    with AISpecGenerator(
+        args.prd, args.spec_name, args.output, args.debug
+    ) as generator:
+        success = generator.run_enhanced_pipeline()
 
     sys.exit(0 if success else 1)
 
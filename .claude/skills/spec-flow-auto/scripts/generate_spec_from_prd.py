@@ -11,59 +11,40 @@ import re
 import sys
 from pathlib import Path
 
-
-class PRDToSpecGenerator:
-    def __init__(self, input_path: str, output_path: str, spec_name: str):
-        self.input_path = Path(input_path)
-        self.output_path = Path(output_path)
-        self.spec_name = spec_name
-        self.spec_dir = self.output_path / spec_name
-
-    def parse_prd(self) -> dict:
-        """PRDドキュメントを解析して構造化データを抽出"""
-        content = self.input_path.read_text(encoding="utf-8")
-
-        # 基本セクションの抽出
-        sections = {}
-
-        # 見出しを抽出
-        re.findall(r"^(#{1,6})\s+(.+)$", content, re.MULTILINE)
-        current_section = None
-        current_content = []
-
-        for line in content.split("\n"):
-            heading_match = re.match(r"^(#{1,6})\s+(.+)$", line)
-            if heading_match:
-                if current_section:
-                    sections[current_section] = "\n".join(current_content)
-                current_section = heading_match[2]
-                current_content = []
-            else:
-                current_content.append(line)
-
-        if current_section:
-            sections[current_section] = "\n".join(current_content)
-
-        return sections
-
-    def generate_requirements_md(self, sections: dict) -> str:
-        """requirements.mdを生成"""
-        return f"""# {self.spec_name} Requirements
+# Markdown見出し（PRD全体に対してMULTILINEで照合）
+_HEADING_RE = re.compile(r"^(#{1,6})[^\S\n]+(.+)$", re.MULTILINE)
+
+# 要件カテゴリごとの見出しキーワードと抜粋の最大文字数
+_REQUIREMENT_CATEGORIES = (
+    ("functional", ("機能", "feature", "requirement"), 500),
+    ("ui", ("ui", "interface", "画面"), 300),
+    ("data", ("data", "database", "データ"), 300),
+)
+
+# 該当セクションがない場合の記載
+_REQUIREMENT_DEFAULTS = {
+    "functional": "主要な機能要件をここに記載",
+    "ui": "ユーザーインターフェース要件をここに記載",
+    "data": "データ管理要件をここに記載",
+}
+
+# requirements.mdのテンプレート（PRDから抽出した可変部分のみformatで埋め込む）
+_REQUIREMENTS_TEMPLATE = """# {spec_name} Requirements
 
 ## Overview
 
-{sections.get('Overview', sections.get('概要', 'このプロジェクトの概要'))}
+{overview}
 
 ## Functional Requirements
 
 ### FR-001: Core Functionality
-{self._extract_functional_requirements(sections)}
+{functional}
 
 ### FR-002: User Interface
-{self._extract_ui_requirements(sections)}
+{ui}
 
 ### FR-003: Data Management
-{self._extract_data_requirements(sections)}
+{data}
 
 ## Non-Functional Requirements
 
@@ -103,10 +84,8 @@ class PRDToSpecGenerator:
 4. **セキュリティ**: 脆弱性診断で高危険度の問題がないこと
 """
 
-    def generate_design_md(self, sections: dict) -> str:
-        """design.mdを生成"""
-        return f"""# {self.spec_name} Design
-
+# design.mdの見出し以降の本文（置換箇所がないためformatを通さず連結する）
+_DESIGN_BODY = """
 ## Architecture Overview
 
 ### System Architecture
@@ -168,9 +147,9 @@ CREATE TABLE roles (
 ```
 GET    /api/v1/users           - ユーザー一覧取得
 POST   /api/v1/users           - ユーザー作成
-GET    /api/v1/users/{{id}}      - ユーザー詳細取得
-PUT    /api/v1/users/{{id}}      - ユーザー更新
-DELETE /api/v1/users/{{id}}      - ユーザー削除
+GET    /api/v1/users/{id}      - ユーザー詳細取得
+PUT    /api/v1/users/{id}      - ユーザー更新
+DELETE /api/v1/users/{id}      - ユーザー削除
 ```
 
 ### Authentication
@@ -222,10 +201,8 @@ FROM python:3.11-slim
 4. **Deploy**: Automated deployment to staging/production
 """
 
-    def generate_tasks_md(self, sections: dict) -> str:
-        """tasks.mdを生成"""
-        return f"""# {self.spec_name} Implementation Tasks
-
+# tasks.mdの見出し以降の本文
+_TASKS_BODY = """
 ## Task Breakdown
 
 ### Phase 1: Foundation Setup
@@ -342,39 +319,78 @@ graph TD
 - 外部APIモックでの事前検証
 """
 
-    def _extract_functional_requirements(self, sections: dict) -> str:
-        """機能要件を抽出"""
-        # セクションから機能要件に関連する内容を抽出
-        for section_name, content in sections.items():
-            if any(
-                keyword in section_name.lower()
-                for keyword in ["機能", "feature", "requirement"]
-            ):
-                return content[:500] + "..." if len(content) > 500 else content
 
-        return "主要な機能要件をここに記載"
+def _truncate(text: str, limit: int) -> str:
+    """上限文字数を超える場合のみ切り詰めて省略記号を付ける"""
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}..."
 
-    def _extract_ui_requirements(self, sections: dict) -> str:
-        """UI要件を抽出"""
-        for section_name, content in sections.items():
-            if any(
-                keyword in section_name.lower()
-                for keyword in ["ui", "interface", "画面"]
-            ):
-                return content[:300] + "..." if len(content) > 300 else content
 
-        return "ユーザーインターフェース要件をここに記載"
+class PRDToSpecGenerator:
+    # 属性を固定し、インスタンスごとの__dict__を持たない
+    __slots__ = ("input_path", "output_path", "spec_name", "spec_dir")
 
-    def _extract_data_requirements(self, sections: dict) -> str:
-        """データ要件を抽出"""
-        for section_name, content in sections.items():
-            if any(
-                keyword in section_name.lower()
-                for keyword in ["data", "database", "データ"]
-            ):
-                return content[:300] + "..." if len(content) > 300 else content
+    def __init__(self, input_path: str, output_path: str, spec_name: str):
+        self.input_path = Path(input_path)
+        self.output_path = Path(output_path)
+        self.spec_name = spec_name
+        self.spec_dir = self.output_path / spec_name
 
-        return "データ管理要件をここに記載"
+    def parse_prd(self) -> dict:
+        """PRDドキュメントを解析して構造化データを抽出"""
+        content = self.input_path.read_text(encoding="utf-8")
+
+        # 基本セクションの抽出
+        sections = {}
+
+        # 見出しを1回の走査で抽出し、次の見出しまでの範囲を本文として切り出す
+        headings = list(_HEADING_RE.finditer(content))
+        for index, heading_match in enumerate(headings):
+            if index + 1 < len(headings):
+                # 次の見出し直前の改行は本文に含めない
+                body_end = headings[index + 1].start() - 1
+            else:
+                body_end = len(content)
+            sections[heading_match[2]] = content[heading_match.end() + 1 : body_end]
+
+        return sections
+
+    def generate_requirements_md(self, sections: dict) -> str:
+        """requirements.mdを生成"""
+        return _REQUIREMENTS_TEMPLATE.format(
+            spec_name=self.spec_name,
+            overview=sections.get(
+                "Overview", sections.get("概要", "このプロジェクトの概要")
+            ),
+            **self._classify_sections(sections),
+        )
+
+    def generate_design_md(self, sections: dict) -> str:
+        """design.mdを生成"""
+        return f"# {self.spec_name} Design\n" + _DESIGN_BODY
+
+    def generate_tasks_md(self, sections: dict) -> str:
+        """tasks.mdを生成"""
+        return f"# {self.spec_name} Implementation Tasks\n" + _TASKS_BODY
+
+    def _classify_sections(self, sections: dict) -> dict[str, str]:
+        """1回の走査でセクションを機能・UI・データ要件に振り分ける"""
+        buckets = {}
+        for section_name, content in sections.items():
+            section_lower = section_name.lower()
+            for category, keywords, limit in _REQUIREMENT_CATEGORIES:
+                if category in buckets:
+                    continue
+                # 各カテゴリは最初に一致したセクションを採用する
+                if any(keyword in section_lower for keyword in keywords):
+                    buckets[category] = _truncate(content, limit)
+            if len(buckets) == len(_REQUIREMENT_CATEGORIES):
+                break
+
+        for category, default in _REQUIREMENT_DEFAULTS.items():
+            buckets.setdefault(category, default)
+        return buckets
 
     def generate_spec(self) -> None:
         """SPEC一式を生成"""
@@ -384,35 +400,39 @@ graph TD
         # PRD解析
         sections = self.parse_prd()
 
-        # 各ドキュメント生成
-        requirements = self.generate_requirements_md(sections)
-        design = self.generate_design_md(sections)
-        tasks = self.generate_tasks_md(sections)
+        generators = (
+            ("requirements.md", self.generate_requirements_md),
+            ("design.md", self.generate_design_md),
+            ("tasks.md", self.generate_tasks_md),
+        )
 
-        # ファイル書き込み
-        (self.spec_dir / "requirements.md").write_text(requirements, encoding="utf-8")
-        (self.spec_dir / "design.md").write_text(design, encoding="utf-8")
-        (self.spec_dir / "tasks.md").write_text(tasks, encoding="utf-8")
+        # 各ドキュメントを順に生成して書き込む（エンコード済みバイト列を書き出す）
+        for file_name, generate in generators:
+            content = generate(sections)
+            (self.spec_dir / file_name).write_bytes(content.encode("utf-8"))
 
-        print(f"✅ Generated SPEC files for '{self.spec_name}':")
-        print(f"   📁 {self.spec_dir}")
-        print("   📄 requirements.md")
-        print("   📄 design.md")
-        print("   📄 tasks.md")
+        # 完了サマリーは1回のprintでまとめて出力する
+        print(
+            f"✅ Generated SPEC files for '{self.spec_name}':\n"
+            f"   📁 {self.spec_dir}\n"
+            "   📄 requirements.md\n"
+            "   📄 design.md\n"
+            "   📄 tasks.md"
+        )
 
 
-def main():
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Generate SPEC from PRD document")
     parser.add_argument("--input", required=True, help="Path to PRD document")
     parser.add_argument("--output", required=True, help="Output directory path")
     parser.add_argument("--spec-name", required=True, help="Specification name")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # 入力ファイル確認
     if not Path(args.input).exists():
         print(f"❌ Input file not found: {args.input}")
-        sys.exit(1)
+        return 1
 
     try:
         generator = PRDToSpecGenerator(args.input, args.output, args.spec_name)
@@ -420,8 +440,10 @@ def main():
 
     except Exception as e:
         print(f"❌ Error generating SPEC: {e}")
-        sys.exit(1)
+        return 1
+
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,53 @@
+"""
+Spec Workflow - JSON入出力の共通ヘルパー
+
+各スクリプトから呼び出される、UTF-8 JSONの書き出し・読み込み関数群。
+orjson があれば C 実装のエンコーダ・デコーダを使い、なければ標準jsonで同じ形式を出力する
+"""
+
+import json
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from typing import Any
+
+# orjson があれば C 実装のエンコーダ・デコーダで JSON を扱う
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def _json_default(obj: object) -> dict:
+    """標準jsonモジュールで直接扱えないデータクラスを辞書に変換"""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dump_json(data: Any) -> bytes:
+    """インデント付きのUTF-8 JSONバイト列に変換"""
+    if ORJSON_AVAILABLE:
+        # orjsonはslots付きデータクラスもそのまま直列化できる
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    return json.dumps(
+        data, indent=2, ensure_ascii=False, default=_json_default
+    ).encode("utf-8")
+
+
+def write_json(path: Path, data: Any) -> None:
+    """JSONをUTF-8で出力（エンコード済みのバイト列を直接書き込む）"""
+    path.write_bytes(dump_json(data))
+
+
+def read_json(path: Path) -> Any:
+    """UTF-8のJSONファイルを読み込む（バイト列を直接解析する）"""
+    # orjson.JSONDecodeError は json.JSONDecodeError のサブクラスのため、
+    # 呼び出し側の例外処理はどちらの実装でも共通
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
+
+    return json.loads(path.read_bytes())
@@ -0,0 +1,129 @@
+"""
+Spec Workflow - PRD・タスク行の文字列解析プリミティブ
+
+enhanced_sdd_pipeline.py から呼び出される、状態を持たない文字列処理関数群。
+型注釈付きの通常のPythonモジュールとしてそのまま動作し、
+`mypyc prd_scan.py` でコンパイルした拡張モジュールがあればそちらが優先して読み込まれる
+"""
+
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+
+# キーワード分類用の正規表現（小文字化したテキストに対して1回の走査で照合）
+_REQUIREMENT_RE = re.compile("requirement|must|should|要件")
+_CONSTRAINT_RE = re.compile("constraint|limit|制約|制限")
+_HIGH_PRIORITY_TEXT_RE = re.compile("critical|security|auth|核心")
+_MEDIUM_PRIORITY_TEXT_RE = re.compile("feature|function|機能")
+_HIGH_PRIORITY_TASK_RE = re.compile("authentication|security|setup|initial")
+_BACKEND_TASK_RE = re.compile("api|backend")
+_FRONTEND_TASK_RE = re.compile("ui|frontend")
+
+# Markdown見出し（1行単位で照合）
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$")
+
+
+def scan_prd_lines(
+    lines: Iterable[str],
+) -> tuple[list[dict], list[dict], list[dict]]:
+    """1回の走査で見出し（機能）・要件・制約をまとめて抽出"""
+    features: list[dict] = []
+    requirements: list[dict] = []
+    constraints: list[dict] = []
+
+    for line in lines:
+        line = line.rstrip("\n")
+
+        # 見出しベースの機能抽出
+        heading_match = _HEADING_RE.match(line)
+        if heading_match:
+            current_section = heading_match[2]
+            features.append(
+                {
+                    "name": current_section,
+                    "type": "feature",
+                    "priority": estimate_priority_from_text(current_section.lower()),
+                    "description": f"Feature related to {current_section}",
+                }
+            )
+
+        line_lower = line.lower()
+
+        # キーワードベースの要件抽出
+        if _REQUIREMENT_RE.search(line_lower):
+            requirements.append(
+                {
+                    "text": line.strip(),
+                    "type": "requirement",
+                    "category": "functional",
+                }
+            )
+
+        # 制約条件の特定
+        if _CONSTRAINT_RE.search(line_lower):
+            constraints.append({"text": line.strip(), "type": "constraint"})
+
+    return features, requirements, constraints
+
+
+@lru_cache(maxsize=1024)
+def estimate_priority_from_text(text_lower: str) -> str:
+    """小文字化済みのテキストから優先度を推定"""
+    if _HIGH_PRIORITY_TEXT_RE.search(text_lower):
+        return "high"
+    if _MEDIUM_PRIORITY_TEXT_RE.search(text_lower):
+        return "medium"
+    return "low"
+
+
+@lru_cache(maxsize=1024)
+def classify_task_type(task_lower: str) -> str:
+    """小文字化済みのタスク行からタスクタイプを分類"""
+    if "test" in task_lower:
+        return "testing"
+    if "deploy" in task_lower:
+        return "deployment"
+    if _BACKEND_TASK_RE.search(task_lower):
+        return "backend"
+    if _FRONTEND_TASK_RE.search(task_lower):
+        return "frontend"
+    return "general"
+
+
+def estimate_task_priority(task_lower: str) -> str:
+    """小文字化済みのタスク行から優先度を見積もる"""
+    if _HIGH_PRIORITY_TASK_RE.search(task_lower):
+        return "high"
+    return "medium"
+
+
+def estimate_task_hours(task_lower: str) -> int:
+    """小文字化済みのタスク行から工数を見積もる"""
+    if "setup" in task_lower:
+        return 8
+    if "implementation" in task_lower:
+        return 16
+    if "testing" in task_lower:
+        return 12
+    return 6
+
+
+def estimate_task_complexity(task_lower: str) -> str:
+    """小文字化済みのタスク行から複雑度を見積もる"""
+    if "integration" in task_lower:
+        return "high"
+    return "medium"
+
+
+def extract_task_tags(task_lower: str) -> list[str]:
+    """小文字化済みのタスク行からタグを抽出"""
+    tags = []
+    if "security" in task_lower:
+        tags.append("security")
+    if "performance" in task_lower:
+        tags.append("performance")
+    if "ui" in task_lower:
+        tags.append("frontend")
+    if "api" in task_lower:
+        tags.append("backend")
+    return tags
@@ -7,20 +7,152 @@ PRD解析 → SPEC生成 → タスク分解 → 品質検証 → Miyabi連携
 """
 
 import argparse
+import asyncio
+import contextlib
+import importlib
+import io
 import json
-import subprocess
+import os
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+from json_io import read_json
+
+# 品質検証で存在を確認する出力ファイル
+_REQUIRED_SPEC_FILES = ("requirements.md", "design.md", "tasks.md")
+_REQUIRED_TASK_FILES = ("detailed_tasks.json", "miyabi_integration.json")
+
+# requirements.md の必須セクション
+_REQUIRED_SECTIONS = ("Functional Requirements", "Non-Functional Requirements")
+
+
+# 完了レポートの統計・品質指標セクション
+_STATISTICS_TEMPLATE = """
+### Files Generated
+- requirements.md: {requirements_md:,} bytes
+- design.md: {design_md:,} bytes
+- tasks.md: {tasks_md:,} bytes
+- detailed_tasks.json: {detailed_tasks:,} bytes
+- miyabi_integration.json: {miyabi_integration:,} bytes
+
+### Task Breakdown
+- **Total Tasks**: {total_count}
+- **Total Estimated Hours**: {total_hours}
+- **Critical**: {critical} tasks
+- **High**: {high} tasks
+- **Medium**: {medium} tasks
+- **Low**: {low} tasks
+"""
+_QUALITY_METRICS_TEMPLATE = """
+### Validation Status: {status}
+
+### Quality Checks
+- File Completeness: {completeness}
+- JSON Validity: {json_validity}
+- Content Depth: {content_depth}
+- Task Coverage: {task_coverage}
+
+Issues Found: {issues_found}
+"""
+
+# SPECファイル種別ごとのAI洞察（推奨事項・リスク分析・成功指標）
+_AI_RECOMMENDATIONS = {
+    "requirements.md": """
+- Consider adding non-functional requirements for scalability
+- Include specific performance metrics and SLAs
+- Define clear acceptance criteria for each feature
+- Add compliance and regulatory requirements if applicable
+""",
+    "design.md": """
+- Consider microservices architecture for better scalability
+- Implement caching strategies for improved performance
+- Add comprehensive error handling and logging
+- Design for observability and monitoring from the start
+""",
+    "tasks.md": """
+- Break down large tasks into smaller, manageable units
+- Add specific time estimates and dependencies
+- Include testing and documentation tasks
+- Consider parallel execution opportunities
+""",
+}
+_RISK_ANALYSIS = {
+    "requirements.md": """
+- **Scope Creep**: Requirements may evolve during development
+- **Assumption Risks**: Technical assumptions may prove invalid
+- **Integration Complexity**: Third-party dependencies may pose challenges
+""",
+    "design.md": """
+- **Technical Debt**: Rapid development may accumulate technical debt
+- **Performance Bottlenecks**: Architecture may not scale under load
+- **Security Vulnerabilities**: Design may have security gaps
+""",
+    "tasks.md": """
+- **Timeline Risks**: Task estimates may be optimistic
+- **Dependency Blockers**: External dependencies may cause delays
+- **Resource Constraints**: Team availability may impact timeline
+""",
+}
+_SUCCESS_METRICS = {
+    "requirements.md": """
+- **Feature Coverage**: 100% of requirements implemented
+- **Stakeholder Satisfaction**: Positive feedback from business users
+- **Performance Benchmarks**: All performance targets met
+""",
+    "design.md": """
+- **Code Quality**: Maintainability score > 8/10
+- **Performance**: Response time < 2 seconds for 95% of requests
+- **Scalability**: System handles 10x current load without degradation
+""",
+    "tasks.md": """
+- **Completion Rate**: 95% of tasks completed on schedule
+- **Quality Gates**: All code reviews passed
+- **Test Coverage**: >80% code coverage achieved
+""",
+}
+
+# 常駐ワーカーで事前にインポートしておくサブスクリプトのモジュール
+_SUBSCRIPT_MODULES = ("generate_spec_from_prd", "create_tasks_from_spec")
+
+
+def _preload_subscripts() -> None:
+    """ワーカー起動時にサブスクリプトをインポートし、各フェーズで使い回す"""
+    for module_name in _SUBSCRIPT_MODULES:
+        importlib.import_module(module_name)
+
+
+def _run_subscript_main(module_name: str, argv: list[str]) -> tuple[int, str]:
+    """ワーカー内でサブスクリプトのmainを実行し、(終了コード, 出力)を返す"""
+    main = importlib.import_module(module_name).main
+    # サブプロセス実行時と同様に、サブスクリプトの出力はコンソールに流さない
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        try:
+            returncode = main(argv)
+        except SystemExit as e:
+            # argparse のエラーなどは終了コードとして扱う
+            # （sys.exit() の None は成功、文字列などの終了値は失敗）
+            returncode = (
+                0 if e.code is None else (e.code if isinstance(e.code, int) else 1)
+            )
+    return returncode, output.getvalue()
+
 
 class SDDPipeline:
     def __init__(
-        self, prd_path: str, spec_name: str, output_dir: str = ".spec-workflow"
+        self,
+        prd_path: str,
+        spec_name: str,
+        output_dir: str = ".spec-workflow",
+        fail_fast: bool = True,
     ):
         self.prd_path = Path(prd_path)
         self.spec_name = spec_name
         self.output_dir = Path(output_dir)
+        self.fail_fast = fail_fast
         self.spec_dir = self.output_dir / "specs" / spec_name
         self.tasks_dir = self.output_dir / "tasks" / spec_name
 
@@ -30,24 +162,33 @@ class SDDPipeline:
         self.tasks_script = self.script_dir / "create_tasks_from_spec.py"
         self.validate_script = self.script_dir / "validate_prd_spec_sync.py"
 
-    def run_pipeline(self) -> bool:
+        # 品質チェック・統計・Issueテンプレート生成で共有するJSONの解析結果
+        self._json_cache: dict[Path, dict] = {}
+        # サブスクリプトを実行する常駐ワーカー（run_pipeline の間だけ保持）
+        self._executor: ProcessPoolExecutor | None = None
+
+    async def run_pipeline(self) -> bool:
         """SDDパイプライン全体を実行"""
         print(f"🚀 Starting SDD Pipeline for '{self.spec_name}'")
         print(f"📁 Input PRD: {self.prd_path}")
         print(f"📁 Output: {self.output_dir}")
         print()
 
+        # サブスクリプトは1つの常駐ワーカーで実行し、起動とインポートを1回にまとめる
+        self._executor = ProcessPoolExecutor(
+            max_workers=1, initializer=_preload_subscripts
+        )
         try:
             # Phase 1: 環境準備
             if not self._prepare_environment():
                 return False
 
             # Phase 2: PRDからSPEC生成
-            if not self._generate_spec():
+            if not await self._generate_spec():
                 return False
 
             # Phase 3: SPECからタスク分解
-            if not self._create_tasks():
+            if not await self._create_tasks():
                 return False
 
             # Phase 4: 品質検証
@@ -68,12 +209,15 @@ class SDDPipeline:
             print(f"❌ Pipeline failed: {e}")
             return False
 
+        finally:
+            self._executor.shutdown()
+            self._executor = None
+
     def _prepare_environment(self) -> bool:
         """実行環境を準備"""
         print("🔧 Phase 1: Preparing environment...")
 
-        # 出力ディレクトリ作成
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        # 出力ディレクトリ作成（output_dir は各サブディレクトリの作成時に作られる）
         self.spec_dir.mkdir(parents=True, exist_ok=True)
         self.tasks_dir.mkdir(parents=True, exist_ok=True)
 
@@ -91,30 +235,29 @@ class SDDPipeline:
         print("✅ Environment prepared")
         return True
 
-    def _generate_spec(self) -> bool:
+    async def _generate_spec(self) -> bool:
         """PRDからSPECを生成（AI連携）"""
         print("📝 Phase 2: Generating SPEC from PRD with AI enhancement...")
 
         try:
-            cmd = [
-                "python",
-                str(self.generate_script),
-                "--input",
-                str(self.prd_path),
-                "--output",
-                str(self.output_dir / "specs"),
-                "--spec-name",
-                self.spec_name,
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True)
-
-            if result.returncode != 0:
-                print(f"❌ SPEC generation failed: {result.stderr}")
+            returncode, output = await self._run_script(
+                self.generate_script,
+                [
+                    "--input",
+                    str(self.prd_path),
+                    "--output",
+                    str(self.output_dir / "specs"),
+                    "--spec-name",
+                    self.spec_name,
+                ],
+            )
+
+            if returncode != 0:
+                print(f"❌ SPEC generation failed: {output}")
                 return False
 
             # AIによる品質向上を実行
-            self._enhance_spec_with_ai()
+            await self._enhance_spec_with_ai()
 
             print("✅ AI-enhanced SPEC generated successfully")
             return True
@@ -123,24 +266,30 @@ class SDDPipeline:
             print(f"❌ Error in SPEC generation: {e}")
             return False
 
-    def _create_tasks(self) -> bool:
+    async def _run_script(self, script: Path, argv: list[str]) -> tuple[int, str]:
+        """サブスクリプトを常駐ワーカーで非同期に実行し、(終了コード, 出力)を返す"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, _run_subscript_main, script.stem, argv
+        )
+
+    async def _create_tasks(self) -> bool:
         """SPECからタスクを分解"""
         print("🔨 Phase 3: Creating tasks from SPEC...")
 
         try:
-            cmd = [
-                "python",
-                str(self.tasks_script),
-                "--spec-path",
-                str(self.spec_dir),
-                "--output",
-                str(self.tasks_dir),
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True)
-
-            if result.returncode != 0:
-                print(f"❌ Task creation failed: {result.stderr}")
+            returncode, output = await self._run_script(
+                self.tasks_script,
+                [
+                    "--spec-path",
+                    str(self.spec_dir),
+                    "--output",
+                    str(self.tasks_dir),
+                ],
+            )
+
+            if returncode != 0:
+                print(f"❌ Task creation failed: {output}")
                 return False
 
             print("✅ Tasks created successfully")
@@ -154,16 +303,19 @@ class SDDPipeline:
         """品質を検証"""
         print("🔍 Phase 4: Validating quality...")
 
-        # 各ファイルの存在確認
-        required_files = [
-            self.spec_dir / "requirements.md",
-            self.spec_dir / "design.md",
-            self.spec_dir / "tasks.md",
-            self.tasks_dir / "detailed_tasks.json",
-            self.tasks_dir / "miyabi_integration.json",
-        ]
-
-        missing_files = [f for f in required_files if not f.exists()]
+        # 各ファイルの存在確認（ディレクトリごとに1回の一覧取得で判定）
+        missing_files = []
+        for directory, file_names in (
+            (self.spec_dir, _REQUIRED_SPEC_FILES),
+            (self.tasks_dir, _REQUIRED_TASK_FILES),
+        ):
+            try:
+                present = set(os.listdir(directory))
+            except FileNotFoundError:
+                present = set()
+            missing_files.extend(
+                directory / name for name in file_names if name not in present
+            )
         if missing_files:
             print(f"❌ Missing files: {missing_files}")
             return False
@@ -183,56 +335,82 @@ class SDDPipeline:
     def _perform_quality_checks(self) -> dict:
         """品質チェックを実行"""
         issues = []
-        passed = True
-
-        # requirements.mdのチェック
-        req_file = self.spec_dir / "requirements.md"
-        if req_file.exists():
-            content = req_file.read_text(encoding="utf-8")
-            if len(content) < 1000:
-                issues.append("requirements.md is too short (< 1000 chars)")
-                passed = False
-
-            # 必須セクションの確認
-            required_sections = [
-                "Functional Requirements",
-                "Non-Functional Requirements",
-            ]
-            for section in required_sections:
-                if section not in content:
-                    issues.append(f"Missing section: {section}")
-                    passed = False
-
-        # design.mdのチェック
-        design_file = self.spec_dir / "design.md"
-        if design_file.exists():
-            content = design_file.read_text(encoding="utf-8")
-            if len(content) < 1000:
-                issues.append("design.md is too short (< 1000 chars)")
-                passed = False
-
-        # tasks.mdのチェック
-        tasks_file = self.spec_dir / "tasks.md"
-        if tasks_file.exists():
-            content = tasks_file.read_text(encoding="utf-8")
-            task_count = content.count("- [ ]")
-            if task_count < 5:
-                issues.append(
-                    f"Too few tasks in tasks.md ({task_count} tasks, expected 10+)"
-                )
-                passed = False
 
-        # JSONファイルのバリデーション
-        for json_file in ["detailed_tasks.json", "miyabi_integration.json"]:
-            file_path = self.tasks_dir / json_file
-            if file_path.exists():
-                try:
-                    json.loads(file_path.read_text(encoding="utf-8"))
-                except json.JSONDecodeError as e:
-                    issues.append(f"Invalid JSON in {json_file}: {e}")
-                    passed = False
+        # fail_fast のときは問題が見つかったチェックで打ち切り、残りの走査を省く
+        for check in (
+            self._check_requirements_file,
+            self._check_design_file,
+            self._check_tasks_file,
+            self._check_json_files,
+        ):
+            check_issues = check()
+            issues.extend(check_issues)
+            if check_issues and self.fail_fast:
+                break
+
+        return {"passed": not issues, "issues": issues}
+
+    def _check_requirements_file(self) -> list[str]:
+        """requirements.mdのチェック"""
+        content = self._read_text_if_exists(self.spec_dir / "requirements.md")
+        if content is None:
+            return []
 
-        return {"passed": passed, "issues": issues}
+        issues = []
+        if len(content) < 1000:
+            issues.append("requirements.md is too short (< 1000 chars)")
+
+        # 必須セクションの確認
+        for section in _REQUIRED_SECTIONS:
+            if section not in content:
+                issues.append(f"Missing section: {section}")
+        return issues
+
+    def _check_design_file(self) -> list[str]:
+        """design.mdのチェック"""
+        content = self._read_text_if_exists(self.spec_dir / "design.md")
+        if content is not None and len(content) < 1000:
+            return ["design.md is too short (< 1000 chars)"]
+        return []
+
+    def _check_tasks_file(self) -> list[str]:
+        """tasks.mdのチェック"""
+        content = self._read_text_if_exists(self.spec_dir / "tasks.md")
+        if content is None:
+            return []
+
+        task_count = content.count("- [ ]")
+        if task_count < 5:
+            return [f"Too few tasks in tasks.md ({task_count} tasks, expected 10+)"]
+        return []
+
+    def _check_json_files(self) -> list[str]:
+        """JSONファイルのバリデーション"""
+        issues = []
+        for json_file in ["detailed_tasks.json", "miyabi_integration.json"]:
+            try:
+                self._load_json(self.tasks_dir / json_file)
+            except FileNotFoundError:
+                continue
+            except json.JSONDecodeError as e:
+                issues.append(f"Invalid JSON in {json_file}: {e}")
+        return issues
+
+    def _read_text_if_exists(self, path: Path) -> str | None:
+        """ファイルを読み込む（存在確認を別に行わず、なければNone）"""
+        try:
+            return path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def _load_json(self, path: Path) -> dict:
+        """JSONファイルを読み込む（同一実行内では解析結果を再利用する）"""
+        # 対象のJSONはPhase 3で書き出された後は更新されないため無効化は不要
+        data = self._json_cache.get(path)
+        if data is None:
+            data = read_json(path)
+            self._json_cache[path] = data
+        return data
 
     def _prepare_miyabi_integration(self) -> bool:
         """Miyabi連携準備"""
@@ -257,25 +435,43 @@ class SDDPipeline:
 
     def _generate_miyabi_issue_templates(self) -> None:
         """Miyabi用Issueテンプレートを生成"""
-        miyabi_data = json.loads(
-            (self.tasks_dir / "miyabi_integration.json").read_text(encoding="utf-8")
-        )
+        miyabi_data = self._load_json(self.tasks_dir / "miyabi_integration.json")
 
         templates_dir = self.tasks_dir / "issue_templates"
         templates_dir.mkdir(exist_ok=True)
 
-        # 各エージェント用のIssueテンプレート生成
-        for agent_name, tasks in miyabi_data["agent_tasks"].items():
-            template_content = f"""# {agent_name.replace('_', ' ').title()} Tasks
+        # 各エージェント用のIssueテンプレート生成（エージェントごとに独立して並列実行）
+        agent_tasks = miyabi_data["agent_tasks"]
+        if not agent_tasks:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(8, len(agent_tasks))) as executor:
+            # 結果を消費して書き込み時の例外を呼び出し元へ伝える
+            list(
+                executor.map(
+                    self._write_issue_template,
+                    [templates_dir / f"{name}_issues.md" for name in agent_tasks],
+                    agent_tasks,
+                    agent_tasks.values(),
+                )
+            )
+
+    def _write_issue_template(
+        self, template_file: Path, agent_name: str, tasks: list[dict]
+    ) -> None:
+        """1エージェント分のIssueテンプレートを書き出す"""
+        # 文字列の連結を繰り返さず、部品を並べてから1回で結合する
+        parts = [
+            f"""# {agent_name.replace('_', ' ').title()} Tasks
 
 ## Overview
 {len(tasks)}件の{agent_name}関連タスクが生成されました。
 
 ## Tasks
 """
-
-            for task in tasks:
-                template_content += f"""
+        ]
+        parts.extend(
+            f"""
 ### {task['task_id']}: {task['title']}
 
 **Description**: {task['description']}
@@ -286,10 +482,10 @@ class SDDPipeline:
 ---
 
 """
+            for task in tasks
+        )
 
-            (templates_dir / f"{agent_name}_issues.md").write_text(
-                template_content, encoding="utf-8"
-            )
+        template_file.write_text("".join(parts), encoding="utf-8")
 
     def _generate_completion_report(self) -> None:
         """完了レポートを生成"""
@@ -394,83 +590,94 @@ Generated by Spec Flow Auto Skill
             ("detailed_tasks", self.tasks_dir / "detailed_tasks.json"),
             ("miyabi_integration", self.tasks_dir / "miyabi_integration.json"),
         ]:
-            if file_path.exists():
+            try:
                 stats["files"][file_key] = file_path.stat().st_size
+            except FileNotFoundError:
+                continue
 
         # タスク統計
-        tasks_file = self.tasks_dir / "detailed_tasks.json"
-        if tasks_file.exists():
-            try:
-                tasks_data = json.loads(tasks_file.read_text(encoding="utf-8"))
-                tasks = tasks_data.get("tasks", [])
-                stats["tasks"]["total_count"] = len(tasks)
-                stats["tasks"]["total_hours"] = sum(
-                    t.get("estimated_hours", 0) for t in tasks
-                )
-
-                for task in tasks:
-                    priority = task.get("priority", "medium")
-                    if priority in stats["tasks"]["by_priority"]:
-                        stats["tasks"]["by_priority"][priority] += 1
+        try:
+            tasks_data = self._load_json(self.tasks_dir / "detailed_tasks.json")
+        except FileNotFoundError:
+            pass
+        except json.JSONDecodeError:
+            stats["quality"]["validation_passed"] = False
+            stats["quality"]["issues_found"] += 1
+        else:
+            tasks = tasks_data.get("tasks", [])
+            stats["tasks"]["total_count"] = len(tasks)
+
+            # 工数合計と優先度別の件数を1回の走査で集計
+            total_hours = 0
+            priorities = Counter()
+            for task in tasks:
+                total_hours += task.get("estimated_hours", 0)
+                priorities[task.get("priority", "medium")] += 1
+            stats["tasks"]["total_hours"] = total_hours
 
-            except json.JSONDecodeError:
-                stats["quality"]["validation_passed"] = False
-                stats["quality"]["issues_found"] += 1
+            by_priority = stats["tasks"]["by_priority"]
+            for priority in by_priority:
+                by_priority[priority] = priorities[priority]
 
         return stats
 
     def _format_statistics(self, stats: dict) -> str:
         """統計情報をフォーマット"""
-        return f"""
-### Files Generated
-- requirements.md: {stats['files']['requirements_md']:,} bytes
-- design.md: {stats['files']['design_md']:,} bytes
-- tasks.md: {stats['files']['tasks_md']:,} bytes
-- detailed_tasks.json: {stats['files']['detailed_tasks']:,} bytes
-- miyabi_integration.json: {stats['files']['miyabi_integration']:,} bytes
-
-### Task Breakdown
-- **Total Tasks**: {stats['tasks']['total_count']}
-- **Total Estimated Hours**: {stats['tasks']['total_hours']}
-- **Critical**: {stats['tasks']['by_priority']['critical']} tasks
-- **High**: {stats['tasks']['by_priority']['high']} tasks
-- **Medium**: {stats['tasks']['by_priority']['medium']} tasks
-- **Low**: {stats['tasks']['by_priority']['low']} tasks
-"""
+        # 入れ子の統計を1段のキーに展開し、テンプレートへ1回で埋め込む
+        return _STATISTICS_TEMPLATE.format(
+            **stats["files"], **stats["tasks"], **stats["tasks"]["by_priority"]
+        )
 
     def _format_quality_metrics(self, stats: dict) -> str:
         """品質指標をフォーマット"""
-        status = "✅ PASSED" if stats["quality"]["validation_passed"] else "❌ FAILED"
-
-        return f"""
-### Validation Status: {status}
-
-### Quality Checks
-- File Completeness: {'✅' if stats['files']['detailed_tasks'] > 0 else '❌'}
-- JSON Validity: {'✅' if stats['quality']['validation_passed'] else '❌'}
-- Content Depth: {'✅' if stats['files']['requirements_md'] > 1000 else '❌'}
-- Task Coverage: {'✅' if stats['tasks']['total_count'] >= 10 else '❌'}
-
-Issues Found: {stats['quality']['issues_found']}
-"""
+        validation_passed = stats["quality"]["validation_passed"]
+        return _QUALITY_METRICS_TEMPLATE.format(
+            status="✅ PASSED" if validation_passed else "❌ FAILED",
+            completeness="✅" if stats["files"]["detailed_tasks"] > 0 else "❌",
+            json_validity="✅" if validation_passed else "❌",
+            content_depth="✅" if stats["files"]["requirements_md"] > 1000 else "❌",
+            task_coverage="✅" if stats["tasks"]["total_count"] >= 10 else "❌",
+            issues_found=stats["quality"]["issues_found"],
+        )
 
-    def _enhance_spec_with_ai(self) -> None:
+    async def _enhance_spec_with_ai(self) -> None:
         """AIによるSPEC品質向上"""
         print("   🤖 Applying AI enhancements to SPEC...")
 
-        # 各SPECファイルに対してAIによる拡張を実施
-        for spec_file in ["requirements.md", "design.md", "tasks.md"]:
-            file_path = self.spec_dir / spec_file
-            if file_path.exists():
-                content = file_path.read_text(encoding="utf-8")
-                enhanced_content = self._add_ai_insights(content, spec_file)
-                file_path.write_text(enhanced_content, encoding="utf-8")
+        # 生成日時は全ファイルで共通のため1回だけ求める
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        # 各SPECファイルは互いに独立しているため、読み書きを並行して実施
+        spec_files = ["requirements.md", "design.md", "tasks.md"]
+        enhanced = await asyncio.gather(
+            *(
+                asyncio.to_thread(self._enhance_spec_file, spec_file, timestamp)
+                for spec_file in spec_files
+            )
+        )
+
+        # 完了表示はファイルの並び順で出力する
+        for spec_file, was_enhanced in zip(spec_files, enhanced):
+            if was_enhanced:
                 print(f"   ✅ Enhanced {spec_file} with AI insights")
 
-    def _add_ai_insights(self, content: str, file_type: str) -> str:
-        """AI洞察を追加"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    def _enhance_spec_file(self, spec_file: str, timestamp: str) -> bool:
+        """1つのSPECファイルにAI洞察を追記（ファイルがなければFalse）"""
+        # 洞察は末尾に足すだけなので既存の内容は読まず、末尾へシークして追記する
+        # （"a"モードと違い、ファイルがなければ作成せずにFileNotFoundErrorとなる）
+        try:
+            with (self.spec_dir / spec_file).open("r+b") as spec:
+                content_size = spec.seek(0, os.SEEK_END)
+                insights = self._build_ai_insights(content_size, spec_file, timestamp)
+                spec.write(insights.encode("utf-8"))
+        except FileNotFoundError:
+            return False
+        return True
 
+    def _build_ai_insights(
+        self, content_size: int, file_type: str, timestamp: str
+    ) -> str:
+        """SPECファイルの末尾に追記するAI洞察を生成（content_sizeはバイト数）"""
         ai_insights = f"""
 
 ---
@@ -479,92 +686,38 @@ Issues Found: {stats['quality']['issues_found']}
 *Generated on {timestamp}*
 
 ### Quality Assessment
-- **Content Completeness**: {'✅ Excellent' if len(content) > 3000 else '✅ Good' if len(content) > 1500 else '⚠️ Needs expansion'}
+- **Content Completeness**: {'✅ Excellent' if content_size > 3000 else '✅ Good' if content_size > 1500 else '⚠️ Needs expansion'}
 - **Technical Accuracy**: ✅ Validated
 - **Implementation Feasibility**: ✅ Confirmed
 
 ### AI Recommendations
-{self._generate_ai_recommendations(file_type, content)}
+{self._generate_ai_recommendations(file_type)}
 
 ### Risk Analysis
-{self._generate_risk_analysis(file_type, content)}
+{self._generate_risk_analysis(file_type)}
 
 ### Success Metrics
-{self._generate_success_metrics(file_type, content)}
+{self._generate_success_metrics(file_type)}
 
 ---
 *Enhanced by Spec Flow Auto AI Engine*
 """
 
-        return content + ai_insights
+        return ai_insights
 
-    def _generate_ai_recommendations(self, file_type: str, content: str) -> str:
+    def _generate_ai_recommendations(self, file_type: str) -> str:
         """AI推奨事項を生成"""
-        recommendations = {
-            "requirements.md": """
-- Consider adding non-functional requirements for scalability
-- Include specific performance metrics and SLAs
-- Define clear acceptance criteria for each feature
-- Add compliance and regulatory requirements if applicable
-""",
-            "design.md": """
-- Consider microservices architecture for better scalability
-- Implement caching strategies for improved performance
-- Add comprehensive error handling and logging
-- Design for observability and monitoring from the start
-""",
-            "tasks.md": """
-- Break down large tasks into smaller, manageable units
-- Add specific time estimates and dependencies
-- Include testing and documentation tasks
-- Consider parallel execution opportunities
-""",
-        }
-        return recommendations.get(
+        return _AI_RECOMMENDATIONS.get(
             file_type, "- Review content for completeness and accuracy"
         )
 
-    def _generate_risk_analysis(self, file_type: str, content: str) -> str:
+    def _generate_risk_analysis(self, file_type: str) -> str:
         """リスク分析を生成"""
-        risk_analysis = {
-            "requirements.md": """
-- **Scope Creep**: Requirements may evolve during development
-- **Assumption Risks**: Technical assumptions may prove invalid
-- **Integration Complexity**: Third-party dependencies may pose challenges
-""",
-            "design.md": """
-- **Technical Debt**: Rapid development may accumulate technical debt
-- **Performance Bottlenecks**: Architecture may not scale under load
-- **Security Vulnerabilities**: Design may have security gaps
-""",
-            "tasks.md": """
-- **Timeline Risks**: Task estimates may be optimistic
-- **Dependency Blockers**: External dependencies may cause delays
-- **Resource Constraints**: Team availability may impact timeline
-""",
-        }
-        return risk_analysis.get(file_type, "- Standard implementation risks apply")
+        return _RISK_ANALYSIS.get(file_type, "- Standard implementation risks apply")
 
-    def _generate_success_metrics(self, file_type: str, content: str) -> str:
+    def _generate_success_metrics(self, file_type: str) -> str:
         """成功指標を生成"""
-        success_metrics = {
-            "requirements.md": """
-- **Feature Coverage**: 100% of requirements implemented
-- **Stakeholder Satisfaction**: Positive feedback from business users
-- **Performance Benchmarks**: All performance targets met
-""",
-            "design.md": """
-- **Code Quality**: Maintainability score > 8/10
-- **Performance**: Response time < 2 seconds for 95% of requests
-- **Scalability**: System handles 10x current load without degradation
-""",
-            "tasks.md": """
-- **Completion Rate**: 95% of tasks completed on schedule
-- **Quality Gates**: All code reviews passed
-- **Test Coverage**: >80% code coverage achieved
-""",
-        }
-        return success_metrics.get(file_type, "- Standard quality metrics will apply")
+        return _SUCCESS_METRICS.get(file_type, "- Standard quality metrics will apply")
 
 
 def main():
@@ -572,11 +725,18 @@ def main():
     parser.add_argument("--prd", required=True, help="Path to PRD document")
     parser.add_argument("--spec-name", required=True, help="Specification name")
     parser.add_argument("--output", default=".spec-workflow", help="Output directory")
+    parser.add_argument(
+        "--no-fail-fast",
+        action="store_true",
+        help="Report all quality issues instead of stopping at the first failure",
+    )
 
     args = parser.parse_args()
 
-    pipeline = SDDPipeline(args.prd, args.spec_name, args.output)
-    success = pipeline.run_pipeline()
+    pipeline = SDDPipeline(
+        args.prd, args.spec_name, args.output, fail_fast=not args.no_fail_fast
+    )
+    success = asyncio.run(pipeline.run_pipeline())
 
     sys.exit(0 if success else 1)
 
@@ -6,14 +6,87 @@ SpecWorkflowMcpで必要なディレクトリ構造と設定ファイルを自
 """
 
 import argparse
-import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from json_io import dump_json
+
+# ワークスペースに配置する README.md（書き込み時の再エンコードを避けるため bytes で保持）
+_README_CONTENT = """# Spec Workflow Workspace
+
+This directory contains the Spec Workflow configuration and generated specifications.
+
+## Directory Structure
+
+```
+.spec-workflow/
+├── spec-workflow.json    # Main configuration file
+├── specs/                # Generated specifications
+│   └── [spec-name]/
+│       ├── requirements.md
+│       ├── design.md
+│       └── tasks.md
+├── logs/                 # Workflow logs
+└── approval-requests/     # Approval request metadata
+```
+
+## Usage
+
+1. **Create new specification**:
+   ```
+   "Create a spec from the PRD in README.md"
+   ```
+
+2. **Implement tasks**:
+   ```
+   "Implement the tasks in .spec-workflow/specs/[spec-name]/tasks.md"
+   ```
+
+3. **Check status**:
+   ```
+   /miyabi-status
+   ```
+
+## Integration with Miyabi Framework
+
+This workspace is designed to work seamlessly with the Miyabi framework's autonomous agents:
+
+- **IssueAgent**: Manages specification-related issues
+- **CodeGenAgent**: Implements generated tasks
+- **TestAgent**: Validates implementation
+- **ReviewAgent**: Ensures quality standards
+
+For more information, see the [SpecWorkflowMcp documentation](https://github.com/Pimzino/spec-workflow-mcp).
+""".encode("utf-8")
+
+# ワークスペースの .gitignore（ASCII のみなので bytes リテラルで保持）
+_GITIGNORE_CONTENT = b"""# Spec Workflow ignore patterns
+
+# Logs
+logs/
+*.log
+
+# Temporary files
+*.tmp
+*.temp
+
+# Approval request metadata (may contain sensitive info)
+approval-requests/*.json
+
+# IDE files
+.vscode/
+.idea/
+
+# OS files
+.DS_Store
+Thumbs.db
+"""
+
 
 class SpecWorkspaceSetup:
     def __init__(self, project_root: str = "."):
-        self.project_root = Path(project_root).resolve()
+        self.project_root = Path(project_root).absolute()
         self.spec_workflow_dir = self.project_root / ".spec-workflow"
         self.specs_dir = self.spec_workflow_dir / "specs"
         self.logs_dir = self.spec_workflow_dir / "logs"
@@ -27,10 +100,13 @@ class SpecWorkspaceSetup:
             self._create_directory_structure()
 
             # 設定ファイル生成
-            self._create_config_files()
+            files = self._create_config_files()
 
             # Git無視設定
-            self._setup_git_ignore()
+            files.update(self._setup_git_ignore())
+
+            # 生成したファイルをまとめて並列に書き込む
+            self._write_files(files)
 
             print("✅ SpecWorkflow workspace setup completed!")
             print(f"📁 Workspace: {self.spec_workflow_dir}")
@@ -44,8 +120,8 @@ class SpecWorkspaceSetup:
         """ディレクトリ構造を作成"""
         print("📁 Creating directory structure...")
 
+        # 末端のディレクトリのみ作成し、.spec-workflow 自体は親として作られる
         directories = [
-            self.spec_workflow_dir,
             self.specs_dir,
             self.logs_dir,
             self.spec_workflow_dir / "approval-requests",
@@ -55,8 +131,8 @@ class SpecWorkspaceSetup:
             directory.mkdir(parents=True, exist_ok=True)
             print(f"   Created: {directory}")
 
-    def _create_config_files(self) -> None:
-        """設定ファイルを生成"""
+    def _create_config_files(self) -> dict[Path, bytes]:
+        """設定ファイルの内容を生成"""
         print("⚙️ Creating configuration files...")
 
         # spec-workflow.json
@@ -75,92 +151,28 @@ class SpecWorkspaceSetup:
         }
 
         config_file = self.spec_workflow_dir / "spec-workflow.json"
-        config_file.write_text(
-            json.dumps(config, indent=2, ensure_ascii=False), encoding="utf-8"
-        )
-        print(f"   Created: {config_file}")
+        config_content = dump_json(config)
 
         # README.md
-        readme_content = """# Spec Workflow Workspace
-
-This directory contains the Spec Workflow configuration and generated specifications.
-
-## Directory Structure
-
-```
-.spec-workflow/
-├── spec-workflow.json    # Main configuration file
-├── specs/                # Generated specifications
-│   └── [spec-name]/
-│       ├── requirements.md
-│       ├── design.md
-│       └── tasks.md
-├── logs/                 # Workflow logs
-└── approval-requests/     # Approval request metadata
-```
-
-## Usage
-
-1. **Create new specification**:
-   ```
-   "Create a spec from the PRD in README.md"
-   ```
-
-2. **Implement tasks**:
-   ```
-   "Implement the tasks in .spec-workflow/specs/[spec-name]/tasks.md"
-   ```
-
-3. **Check status**:
-   ```
-   /miyabi-status
-   ```
-
-## Integration with Miyabi Framework
-
-This workspace is designed to work seamlessly with the Miyabi framework's autonomous agents:
-
-- **IssueAgent**: Manages specification-related issues
-- **CodeGenAgent**: Implements generated tasks
-- **TestAgent**: Validates implementation
-- **ReviewAgent**: Ensures quality standards
-
-For more information, see the [SpecWorkflowMcp documentation](https://github.com/Pimzino/spec-workflow-mcp).
-"""
-
         readme_file = self.spec_workflow_dir / "README.md"
-        readme_file.write_text(readme_content, encoding="utf-8")
-        print(f"   Created: {readme_file}")
 
-    def _setup_git_ignore(self) -> None:
-        """Git ignore設定"""
+        return {config_file: config_content, readme_file: _README_CONTENT}
+
+    def _setup_git_ignore(self) -> dict[Path, bytes]:
+        """Git ignore設定の内容を生成"""
         print("🚫 Setting up git ignore...")
 
         gitignore_file = self.spec_workflow_dir / ".gitignore"
-        gitignore_content = """# Spec Workflow ignore patterns
+        return {gitignore_file: _GITIGNORE_CONTENT}
 
-# Logs
-logs/
-*.log
-
-# Temporary files
-*.tmp
-*.temp
-
-# Approval request metadata (may contain sensitive info)
-approval-requests/*.json
-
-# IDE files
-.vscode/
-.idea/
-
-# OS files
-.DS_Store
-Thumbs.db
-"""
+    def _write_files(self, files: dict[Path, bytes]) -> None:
+        """生成したファイルを並列に書き込む"""
+        with ThreadPoolExecutor(max_workers=len(files)) as executor:
+            # 結果を消費して書き込み時の例外を呼び出し元へ伝える
+            list(executor.map(Path.write_bytes, files, files.values()))
 
-        gitignore_file.write_text(gitignore_content, encoding="utf-8")
-        print(f"   Created: {gitignore_file}")
+        for file_path in files:
+            print(f"   Created: {file_path}")
 
 
 def main():
@@ -14,6 +14,9 @@ import time
 from difflib import SequenceMatcher
 from pathlib import Path
 
+# "#"で始まる行（Markdown見出し候補）
+_HEADING_LINE_RE = re.compile(r"^#[^\n]*", re.MULTILINE)
+
 
 class PRDSpecValidator:
     def __init__(self, prd_path: str, spec_path: str, output_path: str):
@@ -306,13 +309,13 @@ class PRDSpecValidator:
     def _extract_sections(self, text: str) -> list[dict]:
         """Markdownセクションを抽出"""
         sections = []
-        lines = text.split("\n")
 
-        for line in lines:
-            if line.startswith("#"):
-                level = len(line) - len(line.lstrip("#"))
-                title = line.lstrip("# ").strip()
-                sections.append({"level": level, "title": title})
+        # 全行のリストを作らず、"#"で始まる行だけを走査する
+        for heading_match in _HEADING_LINE_RE.finditer(text):
+            line = heading_match[0]
+            level = len(line) - len(line.lstrip("#"))
+            title = line.lstrip("# ").strip()
+            sections.append({"level": level, "title": title})
 
         return sections
 
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+SPEC → タスク分解スクリプトのテスト
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+script_dir = Path(__file__).parent / "scripts"
+sys.path.insert(0, str(script_dir))
+
+from create_tasks_from_spec import SpecToTasksConverter
+from generate_spec_from_prd import PRDToSpecGenerator
+
+SAMPLE_PRD = Path(__file__).parent / "assets" / "sample_prd.md"
+
+
+def test_parse_markdown_file_splits_every_heading(tmp_path):
+    """複数の見出しを見出しタイトルごとのセクションに分割する"""
+    spec_file = tmp_path / "design.md"
+    spec_file.write_text(
+        "# Title\nintro\n\n## Architecture\nbody a\n### Details\nbody b\n",
+        encoding="utf-8",
+    )
+
+    converter = SpecToTasksConverter(str(tmp_path), str(tmp_path / "out"))
+    sections = converter._parse_markdown_file(spec_file)
+
+    assert list(sections) == ["Title", "Architecture", "Details"]
+    assert sections["Title"] == {"level": 1, "title": "Title", "content": "intro"}
+    assert sections["Architecture"]["level"] == 2
+    assert sections["Architecture"]["content"] == "body a"
+    assert sections["Details"] == {"level": 3, "title": "Details", "content": "body b"}
+
+
+def test_generate_task_files_from_sample_spec(tmp_path):
+    """サンプルPRDのSPECからタスクを生成し、タスクIDは重複しない"""
+    spec_output = tmp_path / "specs"
+    PRDToSpecGenerator(str(SAMPLE_PRD), str(spec_output), "sample").generate_spec()
+    tasks_dir = tmp_path / "tasks"
+
+    converter = SpecToTasksConverter(str(spec_output / "sample"), str(tasks_dir))
+    converter.generate_task_files()
+
+    detailed_tasks = json.loads(
+        (tasks_dir / "detailed_tasks.json").read_text(encoding="utf-8")
+    )
+    task_ids = [task["id"] for task in detailed_tasks["tasks"]]
+    assert task_ids
+    assert len(task_ids) == len(set(task_ids))
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Enhanced SDD Pipeline のテスト
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+script_dir = Path(__file__).parent / "scripts"
+sys.path.insert(0, str(script_dir))
+
+from enhanced_sdd_pipeline import AISpecGenerator
+
+SAMPLE_PRD = Path(__file__).parent / "assets" / "sample_prd.md"
+
+
+def _run_pipeline(output_dir: Path, prd_path: Path = SAMPLE_PRD) -> bool:
+    with AISpecGenerator(str(prd_path), "sample", str(output_dir)) as generator:
+        return generator.run_enhanced_pipeline()
+
+
+def test_pipeline_completes_on_sample_prd(tmp_path):
+    """サンプルPRDでPhase 7まで完走し、エージェントプランが生成される"""
+    assert _run_pipeline(tmp_path)
+
+    tasks_dir = tmp_path / "tasks" / "sample"
+    assert (tmp_path / "enhanced_completion_report.md").exists()
+
+    # create_tasks_from_spec の agent_tasks 形式からプランを組み立てる
+    miyabi_data = json.loads(
+        (tasks_dir / "miyabi_integration.json").read_text(encoding="utf-8")
+    )
+    assert "agent_tasks" in miyabi_data
+    plan = json.loads(
+        (tasks_dir / "agent_plans" / "codegen_plan.json").read_text(encoding="utf-8")
+    )
+    assert plan["role"] == "AI駆動コード生成"
+    assert plan["execution_order"] == 3
+    assert plan["tasks"] == [
+        task["title"] for task in miyabi_data["agent_tasks"]["codegen_agent_tasks"]
+    ]
+
+
+def test_pipeline_does_not_write_skeleton_cache(tmp_path):
+    """PRD構成キャッシュは作らず、キャッシュは内容キーのエントリのみ"""
+    assert _run_pipeline(tmp_path)
+
+    assert not (tmp_path / ".cache" / "prd_skeletons.json").exists()
+    assert len(list((tmp_path / ".cache").iterdir())) == 1
+
+
+def test_rerun_reuses_cached_prd_analysis(tmp_path):
+    """PRDが変わらなければ解析結果を再利用し、変更されれば再解析する"""
+    prd_path = tmp_path / "prd.md"
+    prd_path.write_bytes(SAMPLE_PRD.read_bytes())
+    output_dir = tmp_path / "out"
+
+    def run() -> bool:
+        with AISpecGenerator(str(prd_path), "sample", str(output_dir)) as generator:
+            assert generator.run_enhanced_pipeline()
+            return generator._prd_cache_hit
+
+    assert not run()
+    assert run()
+
+    with prd_path.open("a", encoding="utf-8") as prd:
+        prd.write("\n## Additional Feature\n- New requirement\n")
+    assert not run()
+
+
+def test_run_script_main_converts_system_exit(tmp_path):
+    """サブスクリプトの argparse エラーはパイプラインを終了させず終了コードになる"""
+    from generate_spec_from_prd import main as generate_main
+
+    with AISpecGenerator(str(SAMPLE_PRD), "sample", str(tmp_path)) as generator:
+        returncode, output = generator._run_script_main(generate_main, ["--bogus"])
+
+    assert returncode == 2
+    assert "--input" in output
+
+
+def test_run_script_main_treats_bare_sys_exit_as_success(tmp_path):
+    """sys.exit() は成功、メッセージ付きの終了は失敗として扱う"""
+    def exit_without_code(argv):
+        sys.exit()
+
+    def exit_with_message(argv):
+        sys.exit("boom")
+
+    with AISpecGenerator(str(SAMPLE_PRD), "sample", str(tmp_path)) as generator:
+        assert generator._run_script_main(exit_without_code, [])[0] == 0
+        assert generator._run_script_main(exit_with_message, [])[0] == 1
+
+
+def test_content_quality_counts_overlapping_markers(tmp_path):
+    """"Non-Functional Requirements" は "Functional Requirements" の配点にも数える"""
+    with AISpecGenerator(str(SAMPLE_PRD), "sample", str(tmp_path)) as generator:
+        generator.spec_dir.mkdir(parents=True)
+        (generator.spec_dir / "requirements.md").write_text(
+            "## Non-Functional Requirements\n", encoding="utf-8"
+        )
+        generator._scan_spec_dir()
+
+        assert generator._check_content_quality() == 0.3 + 0.2
+
+
+
+def test_task_breakdown_is_not_reused_from_another_prd(tmp_path, capsys):
+    """PRD A → B → A の順で実行しても、Bのタスク分解をAに再利用しない"""
+    prd_a = tmp_path / "a.md"
+    prd_a.write_bytes(SAMPLE_PRD.read_bytes())
+    prd_b = tmp_path / "b.md"
+    prd_b.write_bytes(
+        SAMPLE_PRD.read_bytes() + b"\n## Additional Feature\n- New requirement\n"
+    )
+    output_dir = tmp_path / "out"
+
+    def run(prd_path: Path) -> bool:
+        assert _run_pipeline(output_dir, prd_path)
+        return "reusing previous task breakdown" in capsys.readouterr().out
+
+    assert not run(prd_a)
+    assert not run(prd_b)
+    # Aの解析結果はキャッシュ済みだが、タスク出力はBのものなので作り直す
+    assert not run(prd_a)
+    assert run(prd_a)
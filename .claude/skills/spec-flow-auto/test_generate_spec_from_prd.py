@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+PRD → SPEC 生成スクリプトのテスト
+"""
+
+import shutil
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+script_dir = Path(__file__).parent / "scripts"
+sys.path.insert(0, str(script_dir))
+
+from generate_spec_from_prd import PRDToSpecGenerator
+
+SAMPLE_PRD = Path(__file__).parent / "assets" / "sample_prd.md"
+
+
+def test_generate_spec_after_output_removed(tmp_path):
+    """同一プロセスで出力を削除した後も、再生成でディレクトリを作り直す"""
+    output_dir = tmp_path / "specs"
+
+    PRDToSpecGenerator(str(SAMPLE_PRD), str(output_dir), "sample").generate_spec()
+    shutil.rmtree(output_dir)
+    PRDToSpecGenerator(str(SAMPLE_PRD), str(output_dir), "sample").generate_spec()
+
+    for file_name in ("requirements.md", "design.md", "tasks.md"):
+        assert (output_dir / "sample" / file_name).exists()
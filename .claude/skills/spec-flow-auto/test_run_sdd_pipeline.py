@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+従来のSDDパイプラインのテスト
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+script_dir = Path(__file__).parent / "scripts"
+sys.path.insert(0, str(script_dir))
+
+from run_sdd_pipeline import SDDPipeline, _run_subscript_main
+
+SAMPLE_PRD = Path(__file__).parent / "assets" / "sample_prd.md"
+
+
+def test_pipeline_completes_on_sample_prd(tmp_path):
+    """サンプルPRDで全フェーズを完走し、SPEC・タスク・レポートが生成される"""
+    pipeline = SDDPipeline(str(SAMPLE_PRD), "sample", str(tmp_path))
+    assert asyncio.run(pipeline.run_pipeline())
+
+    for file_name in ("requirements.md", "design.md", "tasks.md"):
+        assert (tmp_path / "specs" / "sample" / file_name).exists()
+    for file_name in ("detailed_tasks.json", "miyabi_integration.json"):
+        assert (tmp_path / "tasks" / "sample" / file_name).exists()
+    assert (tmp_path / "completion_report.md").exists()
+
+
+def test_run_subscript_main_converts_system_exit(tmp_path, monkeypatch):
+    """sys.exit() は成功、メッセージ付きの終了は失敗として扱う"""
+    (tmp_path / "exiting_subscript.py").write_text(
+        "import sys\n\n\ndef main(argv):\n    sys.exit(*argv)\n", encoding="utf-8"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    assert _run_subscript_main("exiting_subscript", []) == (0, "")
+    assert _run_subscript_main("exiting_subscript", ["boom"]) == (1, "")
+
+
+def _write_short_spec(spec_dir: Path) -> None:
+    spec_dir.mkdir(parents=True)
+    (spec_dir / "requirements.md").write_text("# Overview\n", encoding="utf-8")
+    (spec_dir / "design.md").write_text("# Design\n", encoding="utf-8")
+
+
+def test_quality_checks_stop_at_first_failing_check_by_default(tmp_path):
+    """fail_fast が既定で、最初に問題が見つかったチェックで打ち切る"""
+    pipeline = SDDPipeline(str(SAMPLE_PRD), "sample", str(tmp_path))
+    _write_short_spec(pipeline.spec_dir)
+
+    result = pipeline._perform_quality_checks()
+
+    assert not result["passed"]
+    assert result["issues"] == [
+        "requirements.md is too short (< 1000 chars)",
+        "Missing section: Functional Requirements",
+        "Missing section: Non-Functional Requirements",
+    ]
+
+
+def test_quality_checks_collect_all_issues_without_fail_fast(tmp_path):
+    """fail_fast=False では全チェックの問題を集める"""
+    pipeline = SDDPipeline(str(SAMPLE_PRD), "sample", str(tmp_path), fail_fast=False)
+    _write_short_spec(pipeline.spec_dir)
+
+    result = pipeline._perform_quality_checks()
+
+    assert "design.md is too short (< 1000 chars)" in result["issues"]
+    assert len(result["issues"]) == 4